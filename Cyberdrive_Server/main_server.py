@@ -3,41 +3,97 @@
 CyberDrive - Main Server (Web Version)
 Serveur backend pour Proxmox - Version web de main.py
 Gère la logique métier sans UI locale, avec interface web accessible de partout
+
+Serveur ASGI (python-socketio AsyncServer + FastAPI) lancé par uvicorn:
+    uvicorn main_server:app --loop uvloop --http httptools --workers 1 --port 5000
 """
 
-from flask import Flask, render_template, jsonify, request
-from flask_socketio import SocketIO, emit, disconnect
-from flask_cors import CORS
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi import Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
 from datetime import datetime
+import asyncio
+import hashlib
 import json
 import logging
 import os
+import socket
 import sys
-import threading
 import time
 from pathlib import Path
 
+import orjson
+import socketio
+from socketio import packet as socketio_packet
+import uvicorn
+
 # Add project root to path (si besoin de tes modules existants)
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 # ==================== Configuration ====================
 
-app = Flask(__name__)
-app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'cyberdrive-secret-change-me')
-app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024  # 50MB max upload
+HOST = os.environ.get('CYBERDRIVE_HOST', '0.0.0.0')
+PORT = int(os.environ.get('CYBERDRIVE_PORT', '5000'))
+TEMPLATES_DIR = project_root / 'templates'
 
-CORS(app, resources={r"/*": {"origins": "*"}})
+api = FastAPI(title='CyberDrive')
+api.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_methods=["*"],
+    allow_headers=["*"]
+)
+
+class OrjsonCodec:
+    """Module json compatible stdlib (dumps/loads) basé sur orjson pour Socket.IO"""
+    
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        # separators/etc. ignorés: orjson produit déjà du JSON compact
+        return orjson.dumps(obj).decode('utf-8')
+    
+    @staticmethod
+    def loads(data, *args, **kwargs):
+        return orjson.loads(data)
 
-socketio = SocketIO(
-    app,
+sio = socketio.AsyncServer(
+    async_mode='asgi',
+    json=OrjsonCodec,
     cors_allowed_origins="*",
-    async_mode='threading',
     ping_timeout=60,
     ping_interval=25,
     max_http_buffer_size=10 * 1024 * 1024
 )
 
+# Caméra: cadence max de diffusion
+CAMERA_FPS = 30
+
+# Télémétrie: cadence max de diffusion aux clients web
+TELEMETRY_HZ = 20
+
+# Files d'envoi par client web (drop-oldest) et backlog engine.io toléré
+CLIENT_QUEUE_SIZES = {
+    'camera_update': 2,
+    'telemetry_update': 4
+}
+ENGINEIO_MAX_QUEUED = 2
+RELAY_BACKOFF = 0.005  # secondes entre deux vérifications du backlog
+
+# Commandes rapides: trames série ESP32 précalculées (CMD:MOVE:{dir}:{thr}\n)
+QUICK = {
+    'forward': b'CMD:MOVE:1500:1650\n',
+    'backward': b'CMD:MOVE:1500:1350\n',
+    'left': b'CMD:MOVE:1300:1500\n',
+    'right': b'CMD:MOVE:1700:1500\n',
+    'stop': b'CMD:MOVE:1500:1500\n',
+    'center': b'CMD:MOVE:1500:1500\n'
+}
+
+# Application ASGI: Socket.IO sur /socket.io, le reste part vers FastAPI
+app = socketio.ASGIApp(sio, other_asgi_app=api)
+
 # Logging
 logging.basicConfig(
     level=logging.INFO,
@@ -48,7 +104,12 @@ logger = logging.getLogger(__name__)
 # ==================== État Global ====================
 
 class ServerState:
-    """État global du serveur"""
+    """
+    État global du serveur
+    Modifié uniquement par les handlers/tâches de la boucle asyncio (un seul
+    thread): pas de verrou nécessaire, les read-modify-write ne s'entrelacent
+    pas tant qu'il n'y a pas d'await au milieu
+    """
     def __init__(self):
         self.web_clients = 0  # Clients web connectés
         self.usb_client_connected = False  # Client USB (PC local) connecté
@@ -67,24 +128,62 @@ class ServerState:
             'mode': 'unknown',
             'timestamp': None
         }
+        self.telemetry_dirty = False  # Nouvelle télémétrie pas encore diffusée
         
-        # Dernière frame caméra
+        # Dernière frame caméra (latest-wins: seule la plus récente est gardée)
         self.last_camera_frame = None
+        self.frame_seq = 0  # Incrémenté à chaque frame reçue
+        self.frame_event = asyncio.Event()  # Remplacé et set() à chaque frame
+        
+        # Clients web: sid -> {event: asyncio.Queue} et sid -> tâches relay
+        self.client_queues = {}
+        self.client_tasks = {}
         
         # Statistiques
         self.commands_sent = 0
         self.telemetry_received = 0
         self.start_time = datetime.now()
+        self.start_monotonic = time.monotonic()
+        
+        # Cache de la réponse /api/status (reconstruite si dirty ou chaque seconde)
+        self.status_dirty = True
+        self.status_bytes = b''
+        self.status_etag = ''
+        self.status_uptime = -1
+        
+        # Cache des configs véhicules (invalidé par mtime)
+        self.vehicle_cache = []
+        self.vehicle_cache_bytes = b'[]'
+        self.vehicle_cache_mtime = None
 
 state = ServerState()
 
 # ==================== Utilitaires ====================
 
+def _ts():
+    """Timestamp des events (epoch float, formaté côté client si besoin)"""
+    return time.time()
+
+def _vehicle_configs_mtime(vehicles_dir):
+    """Signature mtime du dossier et de ses fichiers JSON (None si absent)"""
+    try:
+        signature = [os.stat(vehicles_dir).st_mtime_ns]
+        for json_file in vehicles_dir.glob('*.json'):
+            signature.append(os.stat(json_file).st_mtime_ns)
+    except FileNotFoundError:
+        return None
+    return tuple(signature)
+
 def load_vehicle_configs():
-    """Charge toutes les configurations de véhicules"""
-    vehicles = []
+    """Charge toutes les configurations de véhicules (cache invalidé par mtime)"""
     vehicles_dir = Path('config/vehicles')
     
+    mtime = _vehicle_configs_mtime(vehicles_dir)
+    if mtime is not None and mtime == state.vehicle_cache_mtime:
+        return state.vehicle_cache
+    
+    vehicles = []
+    
     if vehicles_dir.exists():
         for json_file in vehicles_dir.glob('*.json'):
             try:
@@ -95,80 +194,232 @@ def load_vehicle_configs():
             except Exception as e:
                 logger.error(f"Failed to load {json_file}: {e}")
     
+    state.vehicle_cache = vehicles
+    state.vehicle_cache_bytes = orjson.dumps(vehicles)
+    state.vehicle_cache_mtime = mtime
+    
     return vehicles
 
+def _put_drop_old(q, msg):
+    """Ajoute msg à la file bornée, en jetant le plus ancien si elle est pleine"""
+    if q.full():
+        q.get_nowait()
+    q.put_nowait(msg)
+
+def encode_event(event, data):
+    """
+    Encode un événement Socket.IO une seule fois
+    Retourne la liste des paquets engine.io (en-tête + pièces jointes binaires)
+    """
+    pkt = sio.packet_class(socketio_packet.EVENT, data=[event, data], namespace='/')
+    encoded = pkt.encode()
+    return encoded if isinstance(encoded, list) else [encoded]
+
+def broadcast_lossy(event, msg):
+    """Encode msg une fois et le dépose dans la file de chaque client web (flux avec pertes)"""
+    if not state.client_queues:
+        return
+    
+    encoded = encode_event(event, msg)
+    for queues in state.client_queues.values():
+        _put_drop_old(queues[event], encoded)
+
+async def relay(sid, q, event):
+    """
+    Envoie les paquets déjà encodés de la file d'un client web
+    Attend que le transport engine.io du client se vide avant chaque envoi:
+    pendant ce temps la file bornée écrase les messages les plus anciens
+    """
+    eio_sid = sio.manager.eio_sid_from_sid(sid, '/')
+    
+    while True:
+        encoded = await q.get()
+        
+        socket = sio.eio.sockets.get(eio_sid)
+        while socket is not None and socket.queue.qsize() > ENGINEIO_MAX_QUEUED:
+            await sio.sleep(RELAY_BACKOFF)
+            socket = sio.eio.sockets.get(eio_sid)
+        
+        for ep in encoded:
+            await sio.eio.send(eio_sid, ep)
+
+def start_client_relays(sid):
+    """Crée les files et tâches d'envoi d'un client web"""
+    queues = {event: asyncio.Queue(maxsize=size) for event, size in CLIENT_QUEUE_SIZES.items()}
+    state.client_queues[sid] = queues
+    state.client_tasks[sid] = [
+        sio.start_background_task(relay, sid, q, event) for event, q in queues.items()
+    ]
+
+def stop_client_relays(sid):
+    """Arrête les tâches d'envoi d'un client web"""
+    state.client_queues.pop(sid, None)
+    for task in state.client_tasks.pop(sid, []):
+        task.cancel()
+
+async def frame_pump():
+    """
+    Diffuse la dernière frame caméra aux clients web à CAMERA_FPS max
+    Les frames intermédiaires sont écrasées (latest-wins), et chaque client
+    a sa propre file bornée: un client lent ne ralentit pas les autres
+    """
+    interval = 1 / CAMERA_FPS
+    pumped_seq = 0
+    
+    while True:
+        await sio.sleep(interval)
+        
+        if state.frame_seq == pumped_seq:
+            continue
+        
+        pumped_seq = state.frame_seq
+        broadcast_lossy('camera_update', state.last_camera_frame)
+
+async def telemetry_pump():
+    """
+    Diffuse la télémétrie aux clients web à TELEMETRY_HZ max
+    state.last_telemetry reste à jour à chaque paquet; seul le dernier
+    état est envoyé, et rien n'est émis tant qu'aucun paquet n'arrive
+    """
+    interval = 1 / TELEMETRY_HZ
+    
+    while True:
+        await sio.sleep(interval)
+        
+        if not state.telemetry_dirty:
+            continue
+        
+        state.telemetry_dirty = False
+        broadcast_lossy('telemetry_update', state.last_telemetry)
+
+@api.on_event('startup')
+async def start_background_tasks():
+    """Démarre les tâches de diffusion"""
+    sio.start_background_task(frame_pump)
+    sio.start_background_task(telemetry_pump)
+
 # ==================== Routes HTTP ====================
 
-@app.route('/')
-def index():
+@api.get('/')
+async def index():
     """Page d'accueil - Dashboard principal"""
-    return render_template('index.html')
+    return FileResponse(TEMPLATES_DIR / 'index.html')
+
+def build_status():
+    """Reconstruit le JSON de /api/status si l'état a changé"""
+    uptime = int(time.monotonic() - state.start_monotonic)
+    
+    if state.status_dirty or uptime != state.status_uptime:
+        state.status_bytes = orjson.dumps({
+            'status': 'online',
+            'uptime_seconds': uptime,
+            'web_clients': state.web_clients,
+            'usb_client_connected': state.usb_client_connected,
+            'vehicle_connected': state.vehicle_connected,
+            'current_vehicle': state.current_vehicle_id,
+            'commands_sent': state.commands_sent,
+            'telemetry_received': state.telemetry_received,
+            'last_telemetry': state.last_telemetry
+        })
+        state.status_etag = '"%s"' % hashlib.md5(state.status_bytes).hexdigest()
+        state.status_uptime = uptime
+        state.status_dirty = False
+    
+    return state.status_bytes, state.status_etag
 
-@app.route('/api/status')
-def api_status():
+@api.get('/api/status')
+async def api_status(request: Request):
     """Retourne le status complet du serveur"""
-    uptime = (datetime.now() - state.start_time).total_seconds()
-    
-    return jsonify({
-        'status': 'online',
-        'uptime_seconds': uptime,
-        'web_clients': state.web_clients,
-        'usb_client_connected': state.usb_client_connected,
-        'vehicle_connected': state.vehicle_connected,
-        'current_vehicle': state.current_vehicle_id,
-        'commands_sent': state.commands_sent,
-        'telemetry_received': state.telemetry_received,
-        'last_telemetry': state.last_telemetry
-    })
+    status_bytes, etag = build_status()
+    headers = {'ETag': etag, 'Cache-Control': 'max-age=1'}
+    
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304, headers=headers)
+    
+    return Response(status_bytes, media_type='application/json', headers=headers)
 
-@app.route('/api/vehicles')
-def api_vehicles():
+@api.get('/api/vehicles')
+async def api_vehicles():
     """Liste tous les véhicules configurés"""
-    vehicles = load_vehicle_configs()
-    return jsonify(vehicles)
+    load_vehicle_configs()
+    return Response(state.vehicle_cache_bytes, media_type='application/json')
 
-@app.route('/api/telemetry')
-def api_telemetry():
+@api.get('/api/telemetry')
+async def api_telemetry():
     """Retourne la dernière télémétrie"""
-    return jsonify(state.last_telemetry)
+    return state.last_telemetry
+
+@api.get('/api/camera.jpg')
+async def api_camera_snapshot():
+    """Dernière frame caméra (JPEG servi tel quel, sans copie)"""
+    if state.last_camera_frame is None:
+        return Response(status_code=204)
+    
+    return Response(
+        state.last_camera_frame,
+        media_type='image/jpeg',
+        headers={'Cache-Control': 'no-cache'}
+    )
+
+async def mjpeg_frames():
+    """Générateur MJPEG: attend chaque nouvelle frame (pas de polling)"""
+    while True:
+        await state.frame_event.wait()
+        frame = state.last_camera_frame
+        yield b'--frame\r\nContent-Type: image/jpeg\r\nContent-Length: %d\r\n\r\n' % len(frame)
+        yield frame
+        yield b'\r\n'
+
+@api.get('/api/camera.mjpg')
+async def api_camera_stream():
+    """Flux MJPEG de la caméra (pour les clients qui n'ont besoin que de la vidéo)"""
+    return StreamingResponse(
+        mjpeg_frames(),
+        media_type='multipart/x-mixed-replace; boundary=frame',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
 
 # ==================== WebSocket Events ====================
 
-@socketio.on('connect')
-def handle_connect():
+@sio.on('connect')
+async def handle_connect(sid, environ, auth=None):
     """Nouveau client connecté"""
-    logger.info(f"Client connecté: {request.sid}")
-    emit('server_status', {
+    logger.info(f"Client connecté: {sid}")
+    await sio.emit('server_status', {
         'status': 'connected',
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': _ts(),
         'usb_client_online': state.usb_client_connected,
         'vehicle_online': state.vehicle_connected
-    })
+    }, to=sid)
 
-@socketio.on('disconnect')
-def handle_disconnect():
+@sio.on('disconnect')
+async def handle_disconnect(sid):
     """Client déconnecté"""
     global state
     
     # Vérifier si c'est le client USB qui se déconnecte
-    if request.sid == state.usb_client_sid:
+    if sid == state.usb_client_sid:
         logger.warning("Client USB déconnecté!")
         state.usb_client_connected = False
         state.usb_client_sid = None
         state.vehicle_connected = False
+        state.status_dirty = True
         
         # Notifier tous les clients web
-        socketio.emit('usb_client_disconnected', {'timestamp': datetime.now().isoformat()})
+        await sio.emit('usb_client_disconnected', {'timestamp': _ts()})
     else:
         # Client web normal
         state.web_clients = max(0, state.web_clients - 1)
+        state.status_dirty = True
+    
+    stop_client_relays(sid)
     
-    logger.info(f"Client déconnecté: {request.sid} (Web clients: {state.web_clients})")
+    logger.info(f"Client déconnecté: {sid} (Web clients: {state.web_clients})")
 
 # ==================== Événements Client USB ====================
 
-@socketio.on('usb_client_register')
-def handle_usb_client_register(data):
+@sio.on('usb_client_register')
+async def handle_usb_client_register(sid, data):
     """
     Le client USB s'enregistre auprès du serveur
     C'est le PC local avec l'ESP32 branché en USB
@@ -176,55 +427,58 @@ def handle_usb_client_register(data):
     global state
     
     state.usb_client_connected = True
-    state.usb_client_sid = request.sid
+    state.usb_client_sid = sid
+    state.status_dirty = True
     
-    logger.info(f"✓ Client USB enregistré: {request.sid}")
+    logger.info(f"✓ Client USB enregistré: {sid}")
     logger.info(f"  Port série: {data.get('port', 'unknown')}")
     
     # Confirmer au client USB
-    emit('usb_registration_ok', {
-        'server_time': datetime.now().isoformat(),
+    await sio.emit('usb_registration_ok', {
+        'server_time': _ts(),
         'message': 'USB client registered successfully'
-    })
+    }, to=sid)
     
     # Notifier tous les clients web
-    socketio.emit('usb_client_connected', {
-        'timestamp': datetime.now().isoformat(),
+    await sio.emit('usb_client_connected', {
+        'timestamp': _ts(),
         'port': data.get('port', 'unknown')
-    }, broadcast=True)
+    })
 
-@socketio.on('vehicle_connected')
-def handle_vehicle_connected(data):
+@sio.on('vehicle_connected')
+async def handle_vehicle_connected(sid, data):
     """Le véhicule ESP32/Arduino est connecté"""
     global state
     
     state.vehicle_connected = True
     state.current_vehicle_id = data.get('vehicle_id', 'unknown')
+    state.status_dirty = True
     
     logger.info(f"✓ Véhicule connecté: {state.current_vehicle_id}")
     
     # Notifier tous les clients
-    socketio.emit('vehicle_status', {
+    await sio.emit('vehicle_status', {
         'connected': True,
         'vehicle_id': state.current_vehicle_id,
-        'timestamp': datetime.now().isoformat()
-    }, broadcast=True)
+        'timestamp': _ts()
+    })
 
-@socketio.on('vehicle_disconnected')
-def handle_vehicle_disconnected():
+@sio.on('vehicle_disconnected')
+async def handle_vehicle_disconnected(sid):
     """Le véhicule est déconnecté"""
     global state
     
     logger.warning("✗ Véhicule déconnecté")
     state.vehicle_connected = False
+    state.status_dirty = True
     
-    socketio.emit('vehicle_status', {
+    await sio.emit('vehicle_status', {
         'connected': False,
-        'timestamp': datetime.now().isoformat()
-    }, broadcast=True)
+        'timestamp': _ts()
+    })
 
-@socketio.on('vehicle_telemetry')
-def handle_vehicle_telemetry(data):
+@sio.on('vehicle_telemetry')
+async def handle_vehicle_telemetry(sid, data):
     """
     Réception de télémétrie depuis le client USB
     Le client USB lit le port série et envoie les données ici
@@ -232,45 +486,54 @@ def handle_vehicle_telemetry(data):
     global state
     
     try:
-        # Mettre à jour l'état
-        state.last_telemetry.update(data)
-        state.last_telemetry['timestamp'] = datetime.now().isoformat()
+        # Mettre à jour l'état: nouveau dict puis swap de référence, les
+        # lecteurs (pump, /api/status) ne voient jamais un état à moitié à jour
+        state.last_telemetry = {**state.last_telemetry, **data, 'timestamp': _ts()}
         state.telemetry_received += 1
+        state.status_dirty = True
         
-        # Broadcast à tous les clients web
-        socketio.emit('telemetry_update', state.last_telemetry, broadcast=True)
+        # Diffusion différée: telemetry_pump broadcast à TELEMETRY_HZ max
+        state.telemetry_dirty = True
         
     except Exception as e:
         logger.error(f"Erreur traitement télémétrie: {e}")
 
-@socketio.on('camera_frame')
-def handle_camera_frame(data):
-    """Réception d'une frame caméra (base64)"""
+@sio.on('camera_frame')
+async def handle_camera_frame(sid, data):
+    """Réception d'une frame caméra (JPEG brut, frame binaire Socket.IO)"""
     global state
     
+    if not isinstance(data, (bytes, bytearray)):
+        logger.warning(f"Frame caméra ignorée (attendu: bytes, reçu: {type(data).__name__})")
+        return
+    
     try:
-        state.last_camera_frame = data.get('frame')
+        # Pas d'emit ici: frame_pump diffuse la plus récente à cadence bornée
+        state.last_camera_frame = data
+        state.frame_seq += 1
         
-        # Broadcast aux clients web (sauf l'émetteur)
-        socketio.emit('camera_update', {
-            'frame': state.last_camera_frame,
-            'timestamp': datetime.now().isoformat()
-        }, broadcast=True, include_self=False)
+        # Réveiller les flux MJPEG en attente
+        frame_event, state.frame_event = state.frame_event, asyncio.Event()
+        frame_event.set()
         
     except Exception as e:
         logger.error(f"Erreur traitement caméra: {e}")
 
 # ==================== Événements Clients Web ====================
 
-@socketio.on('web_client_hello')
-def handle_web_client_hello():
+@sio.on('web_client_hello')
+async def handle_web_client_hello(sid):
     """Un client web s'identifie"""
     global state
+    if sid not in state.client_queues:
+        start_client_relays(sid)
+    
     state.web_clients += 1
+    state.status_dirty = True
     logger.info(f"Client web connecté (Total: {state.web_clients})")
 
-@socketio.on('send_command')
-def handle_send_command(data):
+@sio.on('send_command')
+async def handle_send_command(sid, data):
     """
     Un client web veut envoyer une commande au véhicule
     Le serveur relaie au client USB qui l'envoie via série
@@ -278,11 +541,11 @@ def handle_send_command(data):
     global state
     
     if not state.usb_client_connected:
-        emit('error', {'message': 'Client USB non connecté'})
+        await sio.emit('error', {'message': 'Client USB non connecté'}, to=sid)
         return
     
     if not state.vehicle_connected:
-        emit('error', {'message': 'Véhicule non connecté'})
+        await sio.emit('error', {'message': 'Véhicule non connecté'}, to=sid)
         return
     
     try:
@@ -291,63 +554,65 @@ def handle_send_command(data):
             'direction': data.get('direction', 1500),
             'throttle': data.get('throttle', 1500),
             'mode': data.get('mode', 'manual'),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': _ts()
         }
         
         # Envoyer au client USB (qui va l'envoyer via série)
-        socketio.emit('vehicle_command', command, room=state.usb_client_sid)
+        await sio.emit('vehicle_command', command, to=state.usb_client_sid)
         
         state.commands_sent += 1
-        logger.debug(f"Commande envoyée: DIR={command['direction']} THR={command['throttle']}")
+        state.status_dirty = True
+        logger.debug("Commande envoyée: DIR=%s THR=%s", command['direction'], command['throttle'])
         
-        emit('command_sent', {'status': 'ok', 'command': command})
+        await sio.emit('command_sent', {'status': 'ok', 'command': command}, to=sid)
         
     except Exception as e:
         logger.error(f"Erreur envoi commande: {e}")
-        emit('error', {'message': str(e)})
+        await sio.emit('error', {'message': str(e)}, to=sid)
 
-@socketio.on('quick_command')
-def handle_quick_command(data):
+@sio.on('quick_command')
+async def handle_quick_command(sid, data):
     """
     Commandes rapides (avant, arrière, gauche, droite, stop)
     """
     cmd_type = data.get('command', 'stop')
+    cmd_bytes = QUICK.get(cmd_type)
     
-    # Mapping des commandes
-    commands = {
-        'forward': {'direction': 1500, 'throttle': 1650},
-        'backward': {'direction': 1500, 'throttle': 1350},
-        'left': {'direction': 1300, 'throttle': 1500},
-        'right': {'direction': 1700, 'throttle': 1500},
-        'stop': {'direction': 1500, 'throttle': 1500},
-        'center': {'direction': 1500, 'throttle': 1500}
-    }
-    
-    if cmd_type in commands:
-        handle_send_command(commands[cmd_type])
-    else:
-        emit('error', {'message': f'Commande inconnue: {cmd_type}'})
-
-@socketio.on('ping')
-def handle_ping():
-    """Keepalive"""
-    emit('pong', {'timestamp': datetime.now().isoformat()})
+    if cmd_bytes is None:
+        await sio.emit('error', {'message': f'Commande inconnue: {cmd_type}'}, to=sid)
+        return
+    
+    if not state.usb_client_connected:
+        await sio.emit('error', {'message': 'Client USB non connecté'}, to=sid)
+        return
+    
+    if not state.vehicle_connected:
+        await sio.emit('error', {'message': 'Véhicule non connecté'}, to=sid)
+        return
+    
+    # Trame série déjà prête: envoyée en binaire, écrite telle quelle par le client USB
+    await sio.emit('vehicle_command', cmd_bytes, to=state.usb_client_sid)
+    
+    state.commands_sent += 1
+    state.status_dirty = True
+    
+    await sio.emit('command_sent', {'status': 'ok', 'command': cmd_type}, to=sid)
 
 # ==================== Gestion Véhicules ====================
 
-@socketio.on('select_vehicle')
-def handle_select_vehicle(data):
+@sio.on('select_vehicle')
+async def handle_select_vehicle(sid, data):
     """Sélectionner un véhicule"""
     vehicle_id = data.get('vehicle_id')
     
     if not state.usb_client_connected:
-        emit('error', {'message': 'Client USB non connecté'})
+        await sio.emit('error', {'message': 'Client USB non connecté'}, to=sid)
         return
     
     # Demander au client USB de se connecter à ce véhicule
-    socketio.emit('connect_vehicle', {
+    await sio.emit('connect_vehicle', {
         'vehicle_id': vehicle_id
-    }, room=state.usb_client_sid)
+    }, to=state.usb_client_sid)
     
     logger.info(f"Demande de connexion au véhicule: {vehicle_id}")
 
@@ -358,8 +623,8 @@ def print_banner():
     print("\n" + "=" * 70)
     print("  🚗 CyberDrive - Web Server (Version Proxmox)")
     print("=" * 70)
-    print(f"  Interface Web: http://0.0.0.0:5000")
-    print(f"  API Status:    http://0.0.0.0:5000/api/status")
+    print(f"  Interface Web: http://{HOST}:{PORT}")
+    print(f"  API Status:    http://{HOST}:{PORT}/api/status")
     print(f"  Démarré:       {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 70)
     print("\n  Attente des connexions...")
@@ -374,15 +639,25 @@ if __name__ == '__main__':
     vehicles = load_vehicle_configs()
     logger.info(f"Véhicules chargés: {len(vehicles)}")
     
-    # Lancer le serveur
+    # Lancer le serveur (équivalent de: uvicorn main_server:app --loop uvloop --http httptools)
     try:
-        socketio.run(
+        config = uvicorn.Config(
             app,
-            host='0.0.0.0',  # Accessible depuis l'extérieur
-            port=5000,
-            debug=False,  # Mettre True pour dev
-            allow_unsafe_werkzeug=True  # Pour dev uniquement
+            host=HOST,  # Accessible depuis l'extérieur
+            port=PORT,
+            loop='uvloop',
+            http='httptools',
+            workers=1,  # État global en mémoire: un seul process
+            log_level='info'
         )
+        
+        # Socket d'écoute créé ici pour désactiver Nagle (TCP_NODELAY): les petites
+        # trames de commande/télémétrie partent sans attendre l'ACK (jusqu'à 40ms)
+        # uvloop le positionne aussi sur chaque socket acceptée
+        sock = config.bind_socket()
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        
+        uvicorn.Server(config).run(sockets=[sock])
     except KeyboardInterrupt:
         print("\n\n✓ Arrêt du serveur...")
     except Exception as e:
@@ -22,7 +22,7 @@ fi
 
 # Vérifier si les dépendances sont installées
 echo "🔍 Vérification des dépendances..."
-if ! python3 -c "import flask" &> /dev/null; then
+if ! python3 -c "import fastapi, uvicorn, socketio" &> /dev/null; then
     echo "📦 Installation des dépendances..."
     pip3 install -r requirements.txt --break-system-packages
 else
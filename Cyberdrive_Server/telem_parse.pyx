@@ -0,0 +1,102 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+CyberDrive - Parseur de télémétrie compilé (optionnel)
+Format: TELEM:{dir}:{thr}:{dist}:{batt}:{rx}
+
+Build: cythonize -3 --inplace telem_parse.pyx
+Sans module compilé, web_client.py retombe sur la regex Python.
+"""
+
+cdef inline Py_ssize_t _scan_int(const unsigned char[:] buf, Py_ssize_t i,
+                                 Py_ssize_t n, long *out):
+    """Lit un entier signé à partir de i; retourne l'index suivant ou -1"""
+    cdef bint neg = False
+    cdef long value = 0
+    cdef Py_ssize_t start
+
+    if i < n and buf[i] == 45:  # '-'
+        neg = True
+        i += 1
+
+    start = i
+    while i < n and 48 <= buf[i] <= 57:
+        value = value * 10 + (buf[i] - 48)
+        i += 1
+
+    if i == start:
+        return -1
+
+    out[0] = -value if neg else value
+    return i
+
+
+cdef inline Py_ssize_t _scan_float(const unsigned char[:] buf, Py_ssize_t i,
+                                   Py_ssize_t n, double *out):
+    """Lit un décimal signé (-?\\d+(\\.\\d*)?); retourne l'index suivant ou -1"""
+    cdef bint neg = False
+    cdef long whole = 0
+    cdef double frac = 0.0
+    cdef double scale = 0.1
+    cdef Py_ssize_t start
+
+    if i < n and buf[i] == 45:  # '-'
+        neg = True
+        i += 1
+
+    start = i
+    while i < n and 48 <= buf[i] <= 57:
+        whole = whole * 10 + (buf[i] - 48)
+        i += 1
+
+    if i == start:
+        return -1
+
+    if i < n and buf[i] == 46:  # '.'
+        i += 1
+        while i < n and 48 <= buf[i] <= 57:
+            frac += (buf[i] - 48) * scale
+            scale *= 0.1
+            i += 1
+
+    out[0] = -(whole + frac) if neg else (whole + frac)
+    return i
+
+
+def parse(const unsigned char[:] line):
+    """
+    Parse une trame TELEM (bytes, bytearray ou memoryview)
+
+    Returns:
+        (direction, throttle, distance, battery, rx_active) ou None
+    """
+    cdef Py_ssize_t n = line.shape[0]
+    cdef Py_ssize_t i
+    cdef long direction, throttle, distance
+    cdef double battery
+
+    # Préfixe b'TELEM:'
+    if (n < 6 or line[0] != 84 or line[1] != 69 or line[2] != 76
+            or line[3] != 69 or line[4] != 77 or line[5] != 58):
+        return None
+
+    i = _scan_int(line, 6, n, &direction)
+    if i < 0 or i >= n or line[i] != 58:
+        return None
+
+    i = _scan_int(line, i + 1, n, &throttle)
+    if i < 0 or i >= n or line[i] != 58:
+        return None
+
+    i = _scan_int(line, i + 1, n, &distance)
+    if i < 0 or i >= n or line[i] != 58:
+        return None
+
+    i = _scan_float(line, i + 1, n, &battery)
+    if i < 0 or i + 1 >= n or line[i] != 58:
+        return None
+
+    i += 1
+    if line[i] != 48 and line[i] != 49:  # '0' / '1'
+        return None
+
+    return (direction, throttle, distance, battery, line[i] == 49)
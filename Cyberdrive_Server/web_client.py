@@ -5,23 +5,32 @@ Se connecte à l'ESP32 via USB et communique avec le serveur Proxmox
 Remplace la partie "serial communication" du main.py original
 """
 
+import asyncio
 import serial
 import serial.tools.list_ports
+import serial_asyncio
 import socketio
 import time
 import json
-import threading
+import re
 import logging
 import sys
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import uvloop  # Boucle asyncio en C (non disponible sous Windows)
+except ImportError:
+    uvloop = None
+
 # ==================== Configuration ====================
 
 # À MODIFIER: URL de ton serveur Proxmox
 SERVER_URL = 'http://192.168.1.100:5000'  # ← CHANGE MOI !
 
 SERIAL_BAUDRATE = 115200
+SERIAL_RX_BUFSIZE = 256  # octets (tampon de réception réutilisé, > plus longue trame)
+SERIAL_WRITE_HZ = 50  # Écritures série max/s (boucle de contrôle ESP32)
 RECONNECT_DELAY = 5  # secondes
 
 # Logging
@@ -30,10 +39,11 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
+_DEBUG = logger.isEnabledFor(logging.DEBUG)  # Garde des logs debug coûteux (chemins chauds)
 
 # ==================== Client SocketIO ====================
 
-sio = socketio.Client(
+sio = socketio.AsyncClient(
     reconnection=True,
     reconnection_delay=RECONNECT_DELAY,
     reconnection_attempts=0,  # Infini
@@ -42,10 +52,29 @@ sio = socketio.Client(
 
 # ==================== Variables Globales ====================
 
-serial_connection = None
+serial_connection = None  # serial.Serial sous-jacent (port, is_open)
+serial_transport = None  # Transport asyncio (écritures non bloquantes)
 running = True
 current_vehicle_id = None
 
+# Télémétrie: parseur compilé (telem_parse.pyx) si disponible, sinon regex précompilée
+_TELEM_RE = re.compile(rb'TELEM:(-?\d+):(-?\d+):(-?\d+):(-?\d+(?:\.\d*)?):([01])')
+
+try:
+    from telem_parse import parse as parse_telem
+except ImportError:
+    def parse_telem(raw_line):
+        """Parse une trame TELEM -> (dir, thr, dist, batt, rx) ou None"""
+        match = _TELEM_RE.match(raw_line)
+        if match is None:
+            return None
+        
+        direction, throttle, distance, battery, rx = match.groups()
+        return int(direction), int(throttle), int(distance), float(battery), rx == b'1'
+
+# Commande en attente d'écriture série (seule la plus récente est gardée)
+_command_queue = asyncio.Queue(maxsize=1)
+
 # ==================== Fonctions Série ====================
 
 def list_serial_ports():
@@ -79,9 +108,9 @@ def detect_esp32_port():
     logger.warning("ESP32 non détecté automatiquement")
     return None
 
-def connect_serial(port=None):
-    """Connexion au port série (ESP32)"""
-    global serial_connection
+async def connect_serial(port=None):
+    """Connexion au port série (ESP32), branchée sur la boucle asyncio"""
+    global serial_connection, serial_transport
     
     if port is None:
         # Auto-détection
@@ -96,167 +125,251 @@ def connect_serial(port=None):
                 return False
     
     try:
-        serial_connection = serial.Serial(
+        serial_transport, _ = await serial_asyncio.create_serial_connection(
+            asyncio.get_running_loop(),
+            ESP32Protocol,
             port,
-            SERIAL_BAUDRATE,
-            timeout=1,
-            write_timeout=1
+            baudrate=SERIAL_BAUDRATE
         )
+        serial_connection = serial_transport.serial
         
         # Flush buffers
         serial_connection.reset_input_buffer()
         serial_connection.reset_output_buffer()
         
         logger.info(f"✓ Connecté à {port} @ {SERIAL_BAUDRATE} baud")
-        time.sleep(2)  # Attendre l'initialisation ESP32
+        await asyncio.sleep(2)  # Attendre l'initialisation ESP32
         return True
         
     except Exception as e:
         logger.error(f"✗ Erreur connexion série: {e}")
         return False
 
-def disconnect_serial():
+async def disconnect_serial():
     """Déconnexion du port série"""
-    global serial_connection
-    
-    if serial_connection and serial_connection.is_open:
-        serial_connection.close()
-        logger.info("Port série fermé")
+    if serial_transport is not None:
+        serial_transport.close()
+        await asyncio.sleep(0)  # Laisser connection_lost() fermer le port
 
-# ==================== Thread Lecture Série ====================
+# ==================== Lecture Série (asyncio) ====================
 
-def read_serial_thread():
-    """Thread de lecture continue des données série"""
-    global running, serial_connection
+class ESP32Protocol(asyncio.Protocol):
+    """
+    Protocole série branché sur la boucle asyncio (pyserial-asyncio)
+    Le descripteur du port est surveillé par la boucle: pas de thread de lecture
+    """
     
-    logger.info("Thread de lecture série démarré")
+    def __init__(self):
+        # Tampon unique réutilisé: les lignes sont parsées sur des vues, sans copie
+        self.rxbuf = bytearray(SERIAL_RX_BUFSIZE)
+        self.rxview = memoryview(self.rxbuf)
+        self.rxlen = 0
     
-    while running:
-        try:
-            if serial_connection and serial_connection.is_open:
-                if serial_connection.in_waiting > 0:
-                    raw_line = serial_connection.readline()
-                    
-                    try:
-                        line = raw_line.decode('utf-8', errors='ignore').strip()
-                        
-                        if line:
-                            logger.debug(f"ESP32 → {line}")
-                            
-                            # Parser la télémétrie
-                            if line.startswith("TELEM:"):
-                                parse_and_send_telemetry(line)
-                            
-                            elif line.startswith("ACK:") or line.startswith("HEARTBEAT:"):
-                                logger.debug(f"ESP32: {line}")
-                            
-                            else:
-                                # Autre message
-                                logger.info(f"ESP32: {line}")
-                    
-                    except Exception as e:
-                        logger.warning(f"Erreur décodage: {e}")
+    def connection_made(self, transport):
+        logger.info("Lecture série démarrée")
+    
+    def data_received(self, data):
+        size = len(data)
+        if self.rxlen + size > SERIAL_RX_BUFSIZE:
+            # Ligne trop longue (bruit sur la liaison): on repart de zéro
+            logger.warning("Tampon série plein, données ignorées")
+            self.rxlen = 0
+            data = data[-SERIAL_RX_BUFSIZE:]
+            size = len(data)
+        
+        rxbuf, rxview = self.rxbuf, self.rxview
+        rxlen = self.rxlen
+        rxview[rxlen:rxlen + size] = data
+        rxlen += size
+        
+        # Traiter chaque ligne complète
+        latest = None
+        start = 0
+        while True:
+            end = rxbuf.find(b'\n', start, rxlen)
+            if end < 0:
+                break
+            fields = handle_serial_line(rxview[start:end])
+            if fields is not None:
+                latest = fields
+            start = end + 1
         
-        except Exception as e:
-            logger.error(f"Erreur lecture série: {e}")
-            time.sleep(1)
+        # Une seule émission par lot: seule la trame TELEM la plus récente est envoyée
+        if latest is not None:
+            publish_telemetry(*latest, time.time())
         
-        time.sleep(0.01)  # 100 Hz max
+        # Ramener la ligne incomplète en tête (longueur remise à zéro, pas de réallocation)
+        if start:
+            rxlen -= start
+            rxview[:rxlen] = rxview[start:start + rxlen]
+        
+        self.rxlen = rxlen
+    
+    def connection_lost(self, exc):
+        global serial_transport
+        
+        serial_transport = None
+        if exc is not None:
+            logger.error(f"Erreur lecture série: {exc}")
+        logger.info("Port série fermé")
 
-def parse_and_send_telemetry(telem_string):
+def handle_serial_line(raw_line):
     """
-    Parse la télémétrie ESP32 et l'envoie au serveur
-    Format: TELEM:{dir}:{thr}:{dist}:{batt}:{rx}
+    Traite une ligne reçue de l'ESP32 (vue sur le tampon de réception)
+    Format télémétrie: TELEM:{dir}:{thr}:{dist}:{batt}:{rx}
+    
+    Returns:
+        (direction, throttle, distance, battery, rx_active) pour une trame TELEM, sinon None
     """
+    # Fast path: télémétrie parsée directement sur les bytes
     try:
-        parts = telem_string.strip().split(':')
+        fields = parse_telem(raw_line)
+    except Exception as e:
+        logger.warning(f"Erreur parsing télémétrie: {e}")
+        return None
+    
+    if fields is not None:
+        return fields
+    
+    try:
+        line = bytes(raw_line).decode('utf-8', errors='ignore').strip()
         
-        if len(parts) >= 6 and parts[0] == 'TELEM':
-            telemetry = {
-                'direction': int(parts[1]),
-                'throttle': int(parts[2]),
-                'distance_cm': int(parts[3]),
-                'battery_voltage': float(parts[4]),
-                'rx_active': bool(int(parts[5])),
-                'timestamp': datetime.now().isoformat()
-            }
+        if line:
+            logger.debug("ESP32 → %s", line)
             
-            # Envoyer au serveur via WebSocket
-            if sio.connected:
-                sio.emit('vehicle_telemetry', telemetry)
+            if line.startswith("ACK:") or line.startswith("HEARTBEAT:"):
+                logger.debug("ESP32: %s", line)
             
+            else:
+                # Autre message
+                logger.info("ESP32: %s", line)
+    
     except Exception as e:
-        logger.warning(f"Erreur parsing télémétrie: {e}")
+        logger.warning(f"Erreur décodage: {e}")
+    
+    return None
 
-def write_to_serial(data):
-    """Écrire des données sur le port série"""
-    global serial_connection
+def publish_telemetry(direction, throttle, distance, battery, rx_active, timestamp):
+    """Envoie une trame de télémétrie au serveur"""
+    # Envoyer au serveur via WebSocket
+    if sio.connected:
+        # Dict propre à la trame: emit() ne sérialise qu'à l'exécution de la tâche
+        telemetry = {
+            'direction': direction,
+            'throttle': throttle,
+            'distance_cm': distance,
+            'battery_voltage': battery,
+            'rx_active': rx_active,
+            'timestamp': timestamp
+        }
+        sio.start_background_task(sio.emit, 'vehicle_telemetry', telemetry)
+
+def format_command(data):
+    """Convertit une commande serveur en trame ESP32 (bytes)"""
+    if isinstance(data, bytes):
+        # Trame déjà formatée par le serveur (commandes rapides)
+        return data
+    
+    if isinstance(data, dict):
+        # Format: CMD:MOVE:{dir}:{thr}\n
+        direction = data.get('direction', 1500)
+        throttle = data.get('throttle', 1500)
+        return b'CMD:MOVE:%d:%d\n' % (direction, throttle)
     
+    return str(data).encode('utf-8') + b'\n'
+
+def write_to_serial(cmd_bytes):
+    """Écrire une trame sur le port série"""
     try:
-        if serial_connection and serial_connection.is_open:
-            if isinstance(data, dict):
-                # Convertir la commande en format ESP32
-                # Format: CMD:MOVE:{dir}:{thr}\n
-                direction = data.get('direction', 1500)
-                throttle = data.get('throttle', 1500)
-                cmd_str = f"CMD:MOVE:{direction}:{throttle}\n"
-            else:
-                cmd_str = str(data) + "\n"
-            
-            serial_connection.write(cmd_str.encode('utf-8'))
-            logger.debug(f"Serveur → ESP32: {cmd_str.strip()}")
+        if serial_transport is not None:
+            serial_transport.write(cmd_bytes)
+            if _DEBUG:
+                logger.debug("Serveur → ESP32: %s", cmd_bytes.strip().decode('utf-8'))
             return True
     
     except Exception as e:
         logger.error(f"Erreur écriture série: {e}")
         return False
 
+def queue_command(cmd_bytes):
+    """Remplace la commande en attente par la plus récente (latest-wins)"""
+    try:
+        _command_queue.get_nowait()
+    except asyncio.QueueEmpty:
+        pass
+    
+    _command_queue.put_nowait(cmd_bytes)
+
+async def write_serial_task():
+    """
+    Tâche unique d'écriture série: au plus une commande par période de contrôle
+    Les commandes reçues pendant la période s'écrasent, seule la dernière part
+    """
+    interval = 1 / SERIAL_WRITE_HZ
+    logger.info("Tâche d'écriture série démarrée")
+    
+    while running:
+        cmd_bytes = await _command_queue.get()
+        
+        # USB saturé (contrôle de flux ESP32): ne rien empiler derrière,
+        # attendre que le tampon se vide en gardant la commande la plus récente
+        while serial_transport is not None and serial_transport.get_write_buffer_size():
+            await asyncio.sleep(interval)
+            if not _command_queue.empty():
+                cmd_bytes = _command_queue.get_nowait()
+        
+        write_to_serial(cmd_bytes)
+        await asyncio.sleep(interval)
+
 # ==================== WebSocket Events ====================
 
 @sio.event
-def connect():
+async def connect():
     """Connecté au serveur"""
     logger.info("✓ Connecté au serveur Proxmox")
     
     # S'enregistrer en tant que client USB
-    sio.emit('usb_client_register', {
+    await sio.emit('usb_client_register', {
         'port': serial_connection.port if serial_connection else 'unknown',
         'baudrate': SERIAL_BAUDRATE,
         'timestamp': datetime.now().isoformat()
     })
 
 @sio.event
-def disconnect():
+async def disconnect():
     """Déconnecté du serveur"""
     logger.warning("✗ Déconnecté du serveur")
 
 @sio.event
-def connect_error(data):
+async def connect_error(data):
     """Erreur de connexion"""
     logger.error(f"Erreur connexion serveur: {data}")
 
 @sio.on('usb_registration_ok')
-def on_registration_ok(data):
+async def on_registration_ok(data):
     """Le serveur a confirmé l'enregistrement"""
     logger.info("✓ Enregistrement USB confirmé")
     
     # Notifier que le véhicule est connecté (si série OK)
     if serial_connection and serial_connection.is_open:
-        sio.emit('vehicle_connected', {
+        await sio.emit('vehicle_connected', {
             'vehicle_id': current_vehicle_id or 'rc_car_001',
             'timestamp': datetime.now().isoformat()
         })
 
 @sio.on('vehicle_command')
-def on_vehicle_command(data):
+async def on_vehicle_command(data):
     """Commande reçue du serveur pour le véhicule"""
-    logger.info(f"Commande reçue: DIR={data.get('direction')} THR={data.get('throttle')}")
+    if isinstance(data, bytes):
+        logger.info("Commande reçue: %s", data.strip().decode('ascii', 'replace'))
+    else:
+        logger.info("Commande reçue: DIR=%s THR=%s", data.get('direction'), data.get('throttle'))
     
-    # Envoyer sur le port série
-    write_to_serial(data)
+    # Formatée ici, écrite par write_serial_task (coalescence à SERIAL_WRITE_HZ)
+    queue_command(format_command(data))
 
 @sio.on('connect_vehicle')
-def on_connect_vehicle(data):
+async def on_connect_vehicle(data):
     """Le serveur demande de se connecter à un véhicule spécifique"""
     global current_vehicle_id
     
@@ -267,7 +380,7 @@ def on_connect_vehicle(data):
     
     # Notifier la connexion
     if serial_connection and serial_connection.is_open:
-        sio.emit('vehicle_connected', {
+        await sio.emit('vehicle_connected', {
             'vehicle_id': vehicle_id,
             'timestamp': datetime.now().isoformat()
         })
@@ -289,7 +402,7 @@ def main():
     
     print_banner()
     
-    # 1. Connexion série à l'ESP32
+    # 1. Choix du port série de l'ESP32
     logger.info("Recherche de l'ESP32...")
     ports = list_serial_ports()
     
@@ -313,23 +426,38 @@ def main():
     except (ValueError, IndexError):
         selected_port = ports[0]
     
-    if not connect_serial(selected_port):
+    # 2. Client asyncio (uvloop si disponible)
+    if uvloop is not None:
+        uvloop.install()
+    
+    try:
+        asyncio.run(run_client(selected_port))
+    except KeyboardInterrupt:
+        pass
+    
+    print("✓ Client arrêté proprement.")
+
+async def run_client(selected_port):
+    """Connexion au serveur et boucle principale (asyncio)"""
+    global running
+    
+    # Port série branché sur la boucle
+    if not await connect_serial(selected_port):
         logger.error("Impossible de se connecter au port série!")
         return
     
-    # 2. Connexion au serveur Proxmox
+    # Connexion au serveur Proxmox
     logger.info(f"\nConnexion au serveur: {SERVER_URL}")
     
     try:
-        sio.connect(SERVER_URL)
+        await sio.connect(SERVER_URL)
     except Exception as e:
         logger.error(f"Impossible de se connecter au serveur: {e}")
         logger.info("Vérif: Le serveur tourne ? L'URL est correcte ?")
         logger.info("Le client va continuer d'essayer de se reconnecter...")
     
-    # 3. Démarrer le thread de lecture série
-    read_thread = threading.Thread(target=read_serial_thread, daemon=True)
-    read_thread.start()
+    # 3. Démarrer la tâche d'écriture série (la lecture passe par ESP32Protocol)
+    write_task = asyncio.create_task(write_serial_task())
     
     print("\n" + "=" * 70)
     print("✓ Client USB démarré")
@@ -338,28 +466,24 @@ def main():
     print("\n  Appuie sur Ctrl+C pour quitter")
     print("=" * 70 + "\n")
     
-    # 4. Boucle principale (keepalive)
+    # 4. Attente jusqu'à Ctrl+C (keepalive assuré par les pings engine.io)
     try:
-        while running:
-            time.sleep(1)
-            
-            # Ping périodique si connecté
-            if sio.connected:
-                sio.emit('ping')
+        await asyncio.Event().wait()
     
-    except KeyboardInterrupt:
+    except asyncio.CancelledError:
         print("\n\n✓ Arrêt demandé...")
+    
+    finally:
         running = False
+        write_task.cancel()
         
         # Cleanup
         if sio.connected:
-            sio.emit('vehicle_disconnected')
-            time.sleep(0.5)
-            sio.disconnect()
-        
-        disconnect_serial()
+            await sio.emit('vehicle_disconnected')
+            await asyncio.sleep(0.5)
+            await sio.disconnect()
         
-        print("✓ Client arrêté proprement.")
+        await disconnect_serial()
 
 if __name__ == '__main__':
     # Configuration personnalisée via argument
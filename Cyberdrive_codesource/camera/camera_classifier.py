@@ -4,9 +4,70 @@ Uses simple heuristics for now (can be upgraded to ML later)
 """
 import cv2
 import numpy as np
-from typing import Optional, Tuple
+from typing import Dict, List, Tuple
 from enum import Enum
 
+try:
+    import numba  # Optional: single-pass JIT statistics kernel
+except ImportError:
+    numba = None
+
+# Frames are downscaled to this size (width, height) before analysis
+ANALYSIS_SIZE = (160, 120)
+
+# Gradient magnitude above which a pixel counts as an edge
+EDGE_THRESHOLD = 80
+
+if numba is not None:
+    @numba.njit(cache=True, parallel=True, fastmath=True)
+    def _frame_stats(gray, threshold):
+        """
+        Region sums and bottom-third edge count in one pass over the pixels
+        Inline 3x3 Sobel with the same reflected borders and rounding as the
+        OpenCV path (|gx|/2 + |gy|/2 rounded, saturated to 255)
+        """
+        h, w = gray.shape
+        t1 = h // 3
+        t2 = 2 * h // 3
+        top = 0
+        middle = 0
+        bottom = 0
+        edges = 0
+        
+        for y in numba.prange(h):
+            row = 0
+            for x in range(w):
+                row += int(gray[y, x])
+            
+            if y < t1:
+                top += row
+            elif y < t2:
+                middle += row
+            else:
+                bottom += row
+                
+                # Rows reflected within the bottom third
+                ym = y - 1 if y > t2 else y + 1
+                yp = y + 1 if y < h - 1 else y - 1
+                count = 0
+                for x in range(w):
+                    xm = x - 1 if x > 0 else 1
+                    xp = x + 1 if x < w - 1 else w - 2
+                    gx = (int(gray[ym, xp]) + 2 * int(gray[y, xp]) + int(gray[yp, xp])
+                          - int(gray[ym, xm]) - 2 * int(gray[y, xm]) - int(gray[yp, xm]))
+                    gy = (int(gray[yp, xm]) + 2 * int(gray[yp, x]) + int(gray[yp, xp])
+                          - int(gray[ym, xm]) - 2 * int(gray[ym, x]) - int(gray[ym, xp]))
+                    ax = min(abs(gx), 255)
+                    ay = min(abs(gy), 255)
+                    # round((ax + ay) / 2) > threshold, with round-half-to-even
+                    if ax + ay > 2 * threshold + 1:
+                        count += 1
+                edges += count
+        
+        return top, middle, bottom, edges
+else:
+    _frame_stats = None
+
 class CameraViewType(Enum):
     """Types of camera views"""
     FRONT = "front"           # Vue avant voiture (route devant)
@@ -30,6 +91,24 @@ class CameraClassifier:
             CameraViewType.INTERIOR: "👤",
             CameraViewType.UNKNOWN: "📷"
         }
+        self._slice_cache: Dict[Tuple[int, int], Tuple[slice, slice, slice]] = {}
+        
+        # GPU path when OpenCV is built with CUDA
+        try:
+            self._cuda = cv2.cuda.getCudaEnabledDeviceCount() > 0
+        except (AttributeError, cv2.error):
+            self._cuda = False
+        self._gpu_frame = cv2.cuda_GpuMat() if self._cuda else None
+    
+    def _downscale(self, frame: np.ndarray) -> np.ndarray:
+        """Resize frame to ANALYSIS_SIZE (on the GPU when available)"""
+        if self._cuda:
+            # Only the small result comes back over the bus
+            self._gpu_frame.upload(frame)
+            small = cv2.cuda.resize(self._gpu_frame, ANALYSIS_SIZE, interpolation=cv2.INTER_AREA)
+            return small.download()
+        
+        return cv2.resize(frame, ANALYSIS_SIZE, interpolation=cv2.INTER_AREA)
     
     def classify_from_frames(self, frames: list) -> Tuple[CameraViewType, float]:
         """
@@ -58,29 +137,99 @@ class CameraClassifier:
         if frame is None or frame.size == 0:
             return (CameraViewType.UNKNOWN, 0.0)
         
-        h, w = frame.shape[:2]
+        # Downscale first: region ratios are scale-invariant
+        small = self._downscale(frame)
+        
+        # Green plane as luminance: close enough for these heuristics
+        gray = cv2.extractChannel(small, 1)
+        h, w = gray.shape
         
-        # Convert to grayscale for analysis
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        if _frame_stats is not None:
+            # JIT kernel: every statistic from a single pass
+            top, middle, bottom, edges = _frame_stats(gray, EDGE_THRESHOLD)
+            t1, t2 = h // 3, 2 * h // 3
+            return self._classify_stats(top / (t1 * w), middle / ((t2 - t1) * w),
+                                        bottom / ((h - t2) * w), edges / ((h - t2) * w))
         
         # Analyze different regions
-        top_third = gray[0:h//3, :]
-        middle_third = gray[h//3:2*h//3, :]
-        bottom_third = gray[2*h//3:h, :]
+        sl_top, sl_middle, sl_bottom = self._region_slices(h, w)
+        top_third = gray[sl_top, :]
+        middle_third = gray[sl_middle, :]
+        bottom_third = gray[sl_bottom, :]
         
         # Calculate brightness for each region
-        top_brightness = np.mean(top_third)
-        middle_brightness = np.mean(middle_third)
-        bottom_brightness = np.mean(bottom_third)
+        top_brightness = cv2.mean(top_third)[0]
+        middle_brightness = cv2.mean(middle_third)[0]
+        bottom_brightness = cv2.mean(bottom_third)[0]
+        
+        # Calculate edges on the bottom third only (road detection)
+        gx = cv2.Sobel(bottom_third, cv2.CV_16S, 1, 0, ksize=3)
+        gy = cv2.Sobel(bottom_third, cv2.CV_16S, 0, 1, ksize=3)
+        magnitude = cv2.addWeighted(cv2.convertScaleAbs(gx), 0.5,
+                                    cv2.convertScaleAbs(gy), 0.5, 0)
+        _, edges = cv2.threshold(magnitude, EDGE_THRESHOLD, 255, cv2.THRESH_BINARY)
+        edge_density = cv2.countNonZero(edges) / edges.size
         
-        # Calculate edges (road detection)
-        edges = cv2.Canny(gray, 50, 150)
-        bottom_edges = edges[2*h//3:h, :]
-        edge_density = np.sum(bottom_edges > 0) / bottom_edges.size
+        return self._classify_stats(top_brightness, middle_brightness,
+                                    bottom_brightness, edge_density)
+    
+    def _region_slices(self, h: int, w: int) -> Tuple[slice, slice, slice]:
+        """Top/middle/bottom row slices, computed once per resolution"""
+        slices = self._slice_cache.get((h, w))
+        if slices is None:
+            slices = (slice(0, h // 3), slice(h // 3, 2 * h // 3), slice(2 * h // 3, h))
+            self._slice_cache[(h, w)] = slices
+        return slices
+    
+    def classify_batch(self, frames: List[np.ndarray]) -> List[Tuple[CameraViewType, float]]:
+        """
+        Classify one frame per camera in a single OpenCV pass
+        
+        Frames are downscaled and stacked so Sobel runs once
+        on a contiguous buffer; results match _analyze_frame per frame.
+        
+        Args:
+            frames: List of frames (numpy arrays), one per camera
+            
+        Returns:
+            List of (view_type, confidence) tuples, in input order
+        """
+        results = [(CameraViewType.UNKNOWN, 0.0)] * len(frames)
+        valid = [i for i, f in enumerate(frames) if f is not None and f.size > 0]
+        if not valid:
+            return results
+        
+        n = len(valid)
+        w, h = ANALYSIS_SIZE
+        third = h // 3
+        
+        # Green plane of every frame (same luminance shortcut as _analyze_frame)
+        small = np.stack([self._downscale(frames[i]) for i in valid])
+        gray = np.ascontiguousarray(small[:, :, :, 1])
         
-        # Heuristic rules
-        confidence = 0.5
+        # Region brightness for every frame at once
+        brightness = gray.reshape(n, 3, third, w).mean(axis=(2, 3))
         
+        # Bottom thirds, each padded by one reflected row so the single Sobel
+        # call sees the same borders as the per-frame analysis
+        bottoms = np.pad(gray[:, 2 * third:, :], ((0, 0), (1, 1), (0, 0)), mode='reflect')
+        stacked = bottoms.reshape(n * (third + 2), w)
+        gx = cv2.Sobel(stacked, cv2.CV_16S, 1, 0, ksize=3)
+        gy = cv2.Sobel(stacked, cv2.CV_16S, 0, 1, ksize=3)
+        magnitude = cv2.addWeighted(cv2.convertScaleAbs(gx), 0.5,
+                                    cv2.convertScaleAbs(gy), 0.5, 0)
+        edges = magnitude.reshape(n, third + 2, w)[:, 1:-1, :] > EDGE_THRESHOLD
+        densities = np.count_nonzero(edges, axis=(1, 2)) / (third * w)
+        
+        for k, i in enumerate(valid):
+            top, middle, bottom = brightness[k]
+            results[i] = self._classify_stats(top, middle, bottom, densities[k])
+        
+        return results
+    
+    def _classify_stats(self, top_brightness: float, middle_brightness: float,
+                        bottom_brightness: float, edge_density: float) -> Tuple[CameraViewType, float]:
+        """Apply heuristic rules to region brightness and edge density"""
         # FRONT VIEW: Sky (bright) at top, road (edges) at bottom
         if top_brightness > middle_brightness and edge_density > 0.05:
             return (CameraViewType.FRONT, 0.7)
@@ -94,7 +243,7 @@ class CameraClassifier:
             return (CameraViewType.REAR, 0.6)
         
         # INTERIOR: Often darker, less structure
-        if np.mean(gray) < 80:
+        if (top_brightness + middle_brightness + bottom_brightness) / 3 < 80:
             return (CameraViewType.INTERIOR, 0.5)
         
         return (CameraViewType.UNKNOWN, 0.3)
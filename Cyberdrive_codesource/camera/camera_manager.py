@@ -2,7 +2,11 @@
 Camera manager - detects and manages camera sources
 """
 import cv2
-from typing import List, Dict, Optional
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 import numpy as np
 from utils.logger import get_logger
@@ -10,6 +14,35 @@ from camera.camera_classifier import CameraClassifier, CameraViewType
 
 logger = get_logger()
 
+# Frames whose 64-bit average hash differs by fewer bits reuse the cached view
+HASH_DISTANCE_THRESHOLD = 6
+
+# Concurrent USB probes (indices beyond these wait and can be cancelled)
+USB_PROBE_WORKERS = 4
+
+# Opt-in CPU pinning (Linux, CYBERDRIVE_AFFINITY=1): UI and capture threads on separate cores
+PIN_THREADS = os.environ.get('CYBERDRIVE_AFFINITY') == '1'
+UI_CORES = {0, 1}
+CAPTURE_CORES = {2, 3}
+
+def pin_current_thread(cores: set) -> bool:
+    """
+    Restrict the calling thread to the given cores (no-op unless PIN_THREADS)
+    
+    Returns:
+        True if the affinity was applied
+    """
+    if not PIN_THREADS or not hasattr(os, 'sched_setaffinity'):
+        return False
+    
+    # Only keep cores this process may actually use
+    cores = cores & os.sched_getaffinity(0)
+    if not cores:
+        return False
+    
+    os.sched_setaffinity(0, cores)  # pid 0 = calling thread on Linux
+    return True
+
 @dataclass
 class CameraSource:
     """Camera source information"""
@@ -28,50 +61,82 @@ class CameraManager:
     
     def __init__(self):
         self._available_sources: List[CameraSource] = []
+        self._sources_by_id: Dict[str, CameraSource] = {}  # id -> source
         self._active_cameras: Dict[str, cv2.VideoCapture] = {}
         self._last_frames: Dict[str, np.ndarray] = {}
+        self._frame_lock = threading.Lock()  # Guards _last_frames
+        self._frame_wanted: Dict[str, threading.Event] = {}  # Set by read_frame, cleared on decode
+        self._capture_stop: Dict[str, threading.Event] = {}
+        self._capture_threads: Dict[str, threading.Thread] = {}
         self._classifier = CameraClassifier()
-        self._classification_cache: Dict[str, Tuple] = {}  # Cache results
+        self._classification_cache: Dict[str, Tuple] = {}  # source_id -> (view_type, confidence, timestamp)
+        self._last_hash: Dict[str, int] = {}  # source_id -> average hash of the last classified frame
         
-    def scan_usb_cameras(self, max_index: int = 10) -> List[CameraSource]:
+    def scan_usb_cameras(self, max_index: int = 10, max_misses: int = 2) -> List[CameraSource]:
         """
         Scan for available USB cameras
         
         Args:
             max_index: Maximum camera index to check
+            max_misses: Stop after this many consecutive empty indices
             
         Returns:
             List of detected USB camera sources
         """
         sources = []
         
-        for i in range(max_index):
-            cap = cv2.VideoCapture(i, cv2.CAP_DSHOW)  # DirectShow on Windows
-            if cap.isOpened():
-                # Get camera name (try to get a meaningful name)
-                name = f"USB Camera {i}"
-                
-                # Test if camera actually works
-                ret, frame = cap.read()
-                if ret:
-                    # Get resolution
-                    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-                    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                    
-                    source = CameraSource(
-                        id=f"usb_{i}",
-                        name=name,
-                        type="usb",
-                        index=i,
-                        resolution=(width, height)
-                    )
+        # Driver calls release the GIL: probe indices concurrently, in order
+        with ThreadPoolExecutor(max_workers=USB_PROBE_WORKERS) as executor:
+            futures = [executor.submit(self._probe_usb_index, i) for i in range(max_index)]
+            
+            consecutive_misses = 0
+            for future in futures:
+                source = future.result()
+                if source is None:
+                    consecutive_misses += 1
+                    if consecutive_misses >= max_misses:
+                        break
+                else:
+                    consecutive_misses = 0
                     sources.append(source)
-                    logger.info(f"Found USB camera: {name} ({width}x{height})")
-                
-                cap.release()
+            
+            # Skip probes that have not started yet
+            for future in futures:
+                future.cancel()
         
         return sources
     
+    def _probe_usb_index(self, i: int) -> Optional[CameraSource]:
+        """Probe a single USB camera index, returning its source if it works"""
+        source = None
+        cap = cv2.VideoCapture(i, cv2.CAP_DSHOW)  # DirectShow on Windows
+        if cap.isOpened():
+            # Get camera name (try to get a meaningful name)
+            name = f"USB Camera {i}"
+            
+            # Working devices report a resolution: no need to grab a frame
+            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            
+            if width <= 0 or height <= 0:
+                # Some drivers only report properties after a capture
+                ret, frame = cap.read()
+                if ret:
+                    height, width = frame.shape[:2]
+            
+            if width > 0 and height > 0:
+                source = CameraSource(
+                    id=f"usb_{i}",
+                    name=name,
+                    type="usb",
+                    index=i,
+                    resolution=(width, height)
+                )
+                logger.info(f"Found USB camera: {name} ({width}x{height})")
+        
+        cap.release()
+        return source
+    
     def add_ip_camera(self, name: str, url: str) -> CameraSource:
         """
         Add IP camera source
@@ -93,6 +158,7 @@ class CameraManager:
         )
         
         self._available_sources.append(source)
+        self._sources_by_id[source.id] = source
         logger.info(f"Added IP camera: {name} ({url})")
         return source
     
@@ -119,16 +185,19 @@ class CameraManager:
         )
         
         self._available_sources.append(source)
+        self._sources_by_id[source.id] = source
         logger.info(f"Added DroidCam: {name} ({url})")
         return source
     
     def refresh_sources(self):
         """Refresh available camera sources"""
         self._available_sources.clear()
+        self._sources_by_id.clear()
         
         # Scan USB cameras
         usb_sources = self.scan_usb_cameras()
         self._available_sources.extend(usb_sources)
+        self._sources_by_id.update((s.id, s) for s in usb_sources)
         
         logger.info(f"Found {len(usb_sources)} USB camera(s)")
     
@@ -147,11 +216,7 @@ class CameraManager:
             True if camera opened successfully
         """
         # Find source
-        source = None
-        for s in self._available_sources:
-            if s.id == source_id:
-                source = s
-                break
+        source = self._sources_by_id.get(source_id)
         
         if not source:
             logger.error(f"Camera source not found: {source_id}")
@@ -180,7 +245,27 @@ class CameraManager:
             cap.set(cv2.CAP_PROP_FRAME_HEIGHT, source.resolution[1])
             cap.set(cv2.CAP_PROP_FPS, source.fps)
             
+            # Preallocate the capture buffer at the negotiated resolution
+            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or source.resolution[0]
+            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or source.resolution[1]
+            buffer = np.empty((height, width, 3), dtype=np.uint8)
+            
             self._active_cameras[source_id] = cap
+            
+            # Capture thread: grabs continuously, decodes only on demand
+            stop = threading.Event()
+            wanted = threading.Event()
+            wanted.set()
+            thread = threading.Thread(
+                target=self._capture_loop,
+                args=(source_id, cap, buffer, stop, wanted),
+                daemon=True
+            )
+            self._capture_stop[source_id] = stop
+            self._frame_wanted[source_id] = wanted
+            self._capture_threads[source_id] = thread
+            thread.start()
+            
             logger.info(f"Opened camera: {source.name}")
             return True
             
@@ -191,38 +276,119 @@ class CameraManager:
     def close_camera(self, source_id: str):
         """Close camera source"""
         if source_id in self._active_cameras:
-            self._active_cameras[source_id].release()
+            # The capture thread releases the device itself once its loop exits:
+            # a network grab() can outlast the join timeout
+            self._capture_stop.pop(source_id).set()
+            self._capture_threads.pop(source_id).join(timeout=1.0)
+            self._frame_wanted.pop(source_id, None)
+            
             del self._active_cameras[source_id]
-            if source_id in self._last_frames:
-                del self._last_frames[source_id]
+            with self._frame_lock:
+                self._last_frames.pop(source_id, None)
+            self._classification_cache.pop(source_id, None)
+            self._last_hash.pop(source_id, None)
             logger.info(f"Closed camera: {source_id}")
     
+    def _capture_loop(self, source_id: str, cap: cv2.VideoCapture, back: Optional[np.ndarray],
+                      stop: threading.Event, wanted: threading.Event):
+        """
+        Grab frames continuously so the driver queue never goes stale;
+        decode (retrieve) only once the previous frame has been consumed
+        
+        The thread owns the device and its back buffer for the session.
+        """
+        pin_current_thread(CAPTURE_CORES)
+        
+        try:
+            while not stop.is_set():
+                if not cap.grab():
+                    stop.wait(0.01)
+                    continue
+                
+                if not wanted.is_set():
+                    continue
+                
+                # OpenCV reallocates if the stream size changed
+                ret, frame = cap.retrieve(back)
+                if not ret:
+                    continue
+                
+                wanted.clear()
+                
+                # Publish the new frame; the previous one becomes the back buffer.
+                # Checked under the lock: once closed, a late frame never lands
+                # in a reopened session of the same source
+                with self._frame_lock:
+                    if stop.is_set():
+                        break
+                    back = self._last_frames.get(source_id)
+                    self._last_frames[source_id] = frame
+        finally:
+            cap.release()
+    
     def read_frame(self, source_id: str) -> Optional[np.ndarray]:
         """
-        Read frame from camera
+        Get the latest frame from camera (non-blocking)
         
         Args:
             source_id: Camera source ID
             
         Returns:
-            Frame as numpy array (BGR) or None if failed
+            Frame as numpy array (BGR) or None if no frame yet
+            (the buffer is reused once the next frame has been requested)
         """
         if source_id not in self._active_cameras:
             return None
         
-        cap = self._active_cameras[source_id]
-        ret, frame = cap.read()
+        # Ask the capture thread to decode the next grabbed frame
+        self._frame_wanted[source_id].set()
         
-        if ret:
-            self._last_frames[source_id] = frame
-            return frame
-        else:
-            # Return last frame if read failed
+        with self._frame_lock:
             return self._last_frames.get(source_id)
     
+    def classify_source(self, source_id: str, frame: np.ndarray,
+                        ttl_s: float = 5.0) -> Tuple[CameraViewType, float]:
+        """
+        Classify camera view, reusing the cached result for ttl_s seconds
+        or while the frame is visually unchanged (average hash)
+        
+        Args:
+            source_id: Camera source ID
+            frame: Current frame from this source
+            ttl_s: Cache lifetime in seconds
+            
+        Returns:
+            (view_type, confidence) tuple
+        """
+        now = time.monotonic()
+        cached = self._classification_cache.get(source_id)
+        if cached is not None and now - cached[2] < ttl_s:
+            return cached[0], cached[1]
+        
+        # Same scene as last classification: keep the cached view
+        frame_hash = self._average_hash(frame)
+        previous = self._last_hash.get(source_id)
+        if (cached is not None and previous is not None
+                and (frame_hash ^ previous).bit_count() < HASH_DISTANCE_THRESHOLD):
+            self._classification_cache[source_id] = (cached[0], cached[1], now)
+            return cached[0], cached[1]
+        
+        view_type, confidence = self._classifier.classify_from_frames([frame])
+        self._classification_cache[source_id] = (view_type, confidence, now)
+        self._last_hash[source_id] = frame_hash
+        return view_type, confidence
+    
+    @staticmethod
+    def _average_hash(frame: np.ndarray) -> int:
+        """64-bit average hash: 8x8 grey thumbnail thresholded at its mean"""
+        tiny = cv2.resize(frame, (8, 8), interpolation=cv2.INTER_AREA).mean(axis=2)
+        bits = (tiny > tiny.mean()).astype(np.uint8)
+        return int(np.packbits(bits.flatten()).view('<u8')[0])
+    
     def get_last_frame(self, source_id: str) -> Optional[np.ndarray]:
         """Get last successfully read frame"""
-        return self._last_frames.get(source_id)
+        with self._frame_lock:
+            return self._last_frames.get(source_id)
     
     def is_camera_open(self, source_id: str) -> bool:
         """Check if camera is open"""
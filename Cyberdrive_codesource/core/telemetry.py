@@ -1,11 +1,23 @@
 """
 Telemetry data structures
 """
+import re
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Union
 from datetime import datetime
 
-@dataclass
+# TELEM:{dir}:{thr}:{dist}:{batt}:{rx}[:extra...] (str and bytes variants)
+_TELEM_PATTERN = r'\s*TELEM:(-?\d+):(-?\d+):(-?\d+):([-\d.]+):(\d+)(?::[^\r\n]*)?\s*$'
+_TELEM_RE = re.compile(_TELEM_PATTERN)
+_TELEM_RE_BYTES = re.compile(_TELEM_PATTERN.encode())
+
+@lru_cache(maxsize=256)
+def _move_bytes(direction: int, throttle: int) -> bytes:
+    """Wire encoding of a MOVE command; control loops repeat a few values"""
+    return b'CMD:MOVE:%d:%d\n' % (direction, throttle)
+
+@dataclass(slots=True)
 class VehicleTelemetry:
     """Vehicle telemetry data"""
     
@@ -35,44 +47,77 @@ class VehicleTelemetry:
     
     def to_dict(self) -> dict:
         """Convert to dictionary"""
-        return {
-            'timestamp': self.timestamp.isoformat(),
-            'direction': self.direction,
-            'throttle': self.throttle,
-            'distance_cm': self.distance_cm,
-            'battery_voltage': self.battery_voltage,
-            'rx_active': self.rx_active,
-            'obstacle_detected': self.obstacle_detected,
-            'mode': self.mode,
-            'imu': {
-                'accel': [self.accel_x, self.accel_y, self.accel_z],
-                'gyro': [self.gyro_x, self.gyro_y, self.gyro_z]
-            } if self.accel_x is not None else None
-        }
+        return self.to_dict_into({})
+    
+    def to_dict_into(self, out: dict) -> dict:
+        """
+        Write fields into an existing dictionary (streaming path)
+        The IMU sub-dict and its lists are reused when already present
+        """
+        out['timestamp'] = self.timestamp.isoformat()
+        out['direction'] = self.direction
+        out['throttle'] = self.throttle
+        out['distance_cm'] = self.distance_cm
+        out['battery_voltage'] = self.battery_voltage
+        out['rx_active'] = self.rx_active
+        out['obstacle_detected'] = self.obstacle_detected
+        out['mode'] = self.mode
+        
+        if self.accel_x is None:
+            out['imu'] = None
+        else:
+            imu = out.get('imu')
+            if imu is None:
+                imu = out['imu'] = {'accel': [None, None, None], 'gyro': [None, None, None]}
+            imu['accel'][:] = (self.accel_x, self.accel_y, self.accel_z)
+            imu['gyro'][:] = (self.gyro_x, self.gyro_y, self.gyro_z)
+        
+        return out
     
     @classmethod
-    def from_esp32_string(cls, data: str) -> 'VehicleTelemetry':
+    def from_esp32_string(cls, data: Union[str, bytes]) -> 'VehicleTelemetry':
         """
-        Parse ESP32 telemetry string
+        Parse ESP32 telemetry string (raw serial bytes accepted, no decode needed)
         Format: TELEM:{dir}:{thr}:{dist}:{batt}:{rx}\n
         Example: TELEM:1450:1520:45:11.2:1\n
         """
         try:
-            parts = data.strip().split(':')
-            if len(parts) >= 6 and parts[0] == 'TELEM':
+            if isinstance(data, str):
+                m = _TELEM_RE.match(data)
+            else:
+                m = _TELEM_RE_BYTES.match(data)
+            
+            if m is not None:
                 return cls(
-                    direction=int(parts[1]),
-                    throttle=int(parts[2]),
-                    distance_cm=int(parts[3]),
-                    battery_voltage=float(parts[4]),
-                    rx_active=bool(int(parts[5]))
+                    direction=int(m.group(1)),
+                    throttle=int(m.group(2)),
+                    distance_cm=int(m.group(3)),
+                    battery_voltage=float(m.group(4)),
+                    rx_active=bool(int(m.group(5)))
                 )
-        except (ValueError, IndexError) as e:
+        except ValueError as e:
             raise ValueError(f"Invalid telemetry format: {data}") from e
         
         raise ValueError(f"Invalid telemetry format: {data}")
+    
+    @classmethod
+    def from_fields(cls, fields) -> 'VehicleTelemetry':
+        """
+        Build from the already split TELEM payload (text after 'TELEM:')
+        Fields: [dir, thr, dist, batt, rx, extra...]
+        """
+        try:
+            return cls(
+                direction=int(fields[0]),
+                throttle=int(fields[1]),
+                distance_cm=int(fields[2]),
+                battery_voltage=float(fields[3]),
+                rx_active=bool(int(fields[4]))
+            )
+        except (ValueError, IndexError) as e:
+            raise ValueError(f"Invalid telemetry fields: {fields}") from e
 
-@dataclass
+@dataclass(slots=True)
 class VehicleCommand:
     """Command to send to vehicle"""
     
@@ -87,6 +132,14 @@ class VehicleCommand:
         """
         return f"CMD:MOVE:{self.direction}:{self.throttle}\n"
     
+    def to_esp32_bytes(self) -> bytes:
+        """
+        Convert to ESP32 command bytes, ready for the wire
+        Format: CMD:MOVE:{dir}:{thr}\n
+        Repeated values return the same cached bytes object
+        """
+        return _move_bytes(self.direction, self.throttle)
+    
     def validate(self, limits: dict) -> bool:
         """Validate command against vehicle limits"""
         dir_min = limits.get('dir_min', 1000)
@@ -14,6 +14,11 @@ from utils.config_loader import ConfigLoader
 from vehicle.vehicle_manager import VehicleManager
 from core.telemetry import VehicleCommand
 
+LOOP_PERIOD = 0.1  # 10 Hz update
+
+# Telemetry status line: (clock, dir, thr, dist, batt, rx)
+TELEM_LINE = "\r[{}] Dir: {:4d} | Thr: {:4d} | Dist: {:3d}cm | Batt: {:.1f}V | RX: {}"
+
 def print_banner():
     """Print startup banner"""
     print("\n" + "="*60)
@@ -97,22 +102,35 @@ def main():
         
         print("Press Ctrl+C to exit\n")
         
+        next_tick = time.monotonic()
+        last_second = None
+        clock = ""
+        
         while True:
             # Send neutral command
             vehicle_manager.send_command(neutral_cmd)
             
-            # Receive and display telemetry
-            telem = vehicle_manager.receive_telemetry()
+            # Receive and display the newest telemetry (stale frames dropped)
+            telem = vehicle_manager.drain_telemetry()
             if telem:
-                print(f"\r[{time.strftime('%H:%M:%S')}] "
-                      f"Dir: {telem.direction:4d} | "
-                      f"Thr: {telem.throttle:4d} | "
-                      f"Dist: {telem.distance_cm:3d}cm | "
-                      f"Batt: {telem.battery_voltage:.1f}V | "
-                      f"RX: {'✓' if telem.rx_active else '✗'}",
+                # Reformat the clock only when the wall second changes
+                now = int(time.time())
+                if now != last_second:
+                    last_second = now
+                    clock = time.strftime('%H:%M:%S', time.localtime(now))
+                
+                print(TELEM_LINE.format(clock, telem.direction, telem.throttle,
+                                        telem.distance_cm, telem.battery_voltage,
+                                        '✓' if telem.rx_active else '✗'),
                       end="", flush=True)
             
-            time.sleep(0.1)  # 10 Hz update
+            # Fixed schedule: per-iteration work does not stretch the period
+            next_tick += LOOP_PERIOD
+            sleep_for = next_tick - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            else:
+                next_tick = time.monotonic()  # Fell behind: resync instead of bursting
     
     except KeyboardInterrupt:
         print("\n\nShutting down...")
@@ -8,11 +8,6 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtGui import QIcon
-from PyQt6.QtCore import Qt
-
-from ui.main_window import MainWindow
 from vehicle.vehicle_manager import VehicleManager
 from utils.logger import setup_logger
 from utils.config_loader import ConfigLoader
@@ -40,6 +35,10 @@ def main():
     if not vehicles:
         logger.warning("No vehicle profiles found!")
     
+    # Qt/OpenCV are imported only once config and profiles are loaded
+    from PyQt6.QtWidgets import QApplication
+    from ui.main_window import MainWindow
+    
     # Create Qt application
     app = QApplication(sys.argv)
     app.setApplicationName("CyberDrive")
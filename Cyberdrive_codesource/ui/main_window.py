@@ -3,7 +3,7 @@ Main window for CyberDrive UI
 """
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                               QLabel, QStatusBar, QSplitter)
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QTimer, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QKeyEvent
 from pathlib import Path
 
@@ -13,33 +13,68 @@ from ui.widgets.telemetry_panel import TelemetryPanel
 from ui.widgets.camera_grid import CameraGrid
 from vehicle.vehicle_manager import VehicleManager
 from core.telemetry import VehicleCommand
-from camera.camera_manager import CameraManager
+from camera.camera_manager import CameraManager, pin_current_thread, UI_CORES
 from utils.logger import get_logger
 
 logger = get_logger()
 
+# Control keys as plain ints (event.key() values)
+KEY_Q = int(Qt.Key.Key_Q)
+KEY_D = int(Qt.Key.Key_D)
+KEY_Z = int(Qt.Key.Key_Z)
+KEY_S = int(Qt.Key.Key_S)
+KEY_SPACE = int(Qt.Key.Key_Space)
+
+# One bit per control key in MainWindow.keys_mask
+BIT_Q, BIT_D, BIT_Z, BIT_S, BIT_SPACE = 1, 2, 4, 8, 16
+KEY_BITS = {KEY_Q: BIT_Q, KEY_D: BIT_D, KEY_Z: BIT_Z, KEY_S: BIT_S, KEY_SPACE: BIT_SPACE}
+
+# QSS read once at import (None if missing)
+_STYLESHEET_PATH = Path(__file__).parent / "resources" / "styles.qss"
+_STYLESHEET = _STYLESHEET_PATH.read_text(encoding='utf-8') if _STYLESHEET_PATH.exists() else None
+
+class _ConnectJob(QRunnable):
+    """Connect a vehicle on a pool thread and report the result"""
+    
+    def __init__(self, vehicle_manager: VehicleManager, vehicle_id: str, done):
+        super().__init__()
+        self.vehicle_manager = vehicle_manager
+        self.vehicle_id = vehicle_id
+        self.done = done
+    
+    def run(self):
+        ok = self.vehicle_manager.connect_vehicle(self.vehicle_id)
+        self.done(self.vehicle_id, ok)
+
 class MainWindow(QMainWindow):
     """Main application window"""
     
+    # Emitted from the connect worker; delivered queued on the UI thread
+    connect_done = pyqtSignal(str, bool)  # vehicle_id, success
+    
     def __init__(self, vehicle_manager: VehicleManager):
         super().__init__()
+        pin_current_thread(UI_CORES)  # Opt-in, see CYBERDRIVE_AFFINITY
         self.vehicle_manager = vehicle_manager
         self.camera_manager = CameraManager()
         
-        self.telemetry_timer = QTimer()
-        self.camera_timer = QTimer()
-        self.heartbeat_timer = QTimer()  # Nouveau : heartbeat
+        # Single UI tick (~30 Hz); telemetry and heartbeat run on sub-multiples
+        self._tick_timer = QTimer()
+        self._tick = 0
+        self._link_active = False  # Telemetry/heartbeat only while connected
+        self._hb_write = None  # Bound serial write of the active adapter
+        self._shown_frames: dict[int, int] = {}  # slot_index -> id of the last displayed frame
         
         # Keyboard control state
         self.current_dir = 1500
         self.current_thr = 1500
-        self.keys_pressed = set()
+        self.keys_mask = 0  # KEY_BITS of the control keys held down
         
         # Control mode
         self.manual_control_active = False
         
+        self.load_stylesheet()  # Before children exist: no repolish pass
         self.setup_ui()
-        self.load_stylesheet()
         self.setup_connections()
         self.load_vehicles()
         self.init_cameras()
@@ -121,27 +156,20 @@ class MainWindow(QMainWindow):
         
     def load_stylesheet(self):
         """Load QSS stylesheet"""
-        style_path = Path(__file__).parent / "resources" / "styles.qss"
-        if style_path.exists():
-            with open(style_path, 'r', encoding='utf-8') as f:
-                self.setStyleSheet(f.read())
+        if _STYLESHEET is not None:
+            self.setStyleSheet(_STYLESHEET)
             logger.info("Loaded stylesheet")
         else:
-            logger.warning(f"Stylesheet not found: {style_path}")
+            logger.warning(f"Stylesheet not found: {_STYLESHEET_PATH}")
     
     def setup_connections(self):
         """Setup signal/slot connections"""
         self.connection_widget.connect_clicked.connect(self.on_connect)
         self.connection_widget.disconnect_clicked.connect(self.on_disconnect)
+        self.connect_done.connect(self._on_connect_done)
         
-        # Telemetry timer (10 Hz)
-        self.telemetry_timer.timeout.connect(self.update_telemetry)
-        
-        # Camera timer (30 Hz)
-        self.camera_timer.timeout.connect(self.update_cameras)
-        
-        # Heartbeat timer (1 Hz) - envoie juste un ping
-        self.heartbeat_timer.timeout.connect(self.send_heartbeat)
+        # UI tick: cameras 30 Hz, telemetry 10 Hz, heartbeat 2 Hz
+        self._tick_timer.timeout.connect(self._on_tick)
         
         # Camera source changes
         for widget in self.camera_grid.camera_widgets:
@@ -158,22 +186,34 @@ class MainWindow(QMainWindow):
         
         logger.info(f"Camera system initialized with {len(sources)} source(s)")
         
-        # Start camera update timer (30 FPS)
-        self.camera_timer.start(33)  # ~30 Hz
+        # Start UI tick (30 FPS)
+        self._tick_timer.start(33)  # ~30 Hz
+    
+    def _on_tick(self):
+        """Dispatch periodic work from the single UI timer"""
+        self._tick += 1
+        self.update_cameras()
+        
+        if self._link_active:
+            if self._tick % 3 == 0:
+                self.update_telemetry()   # 10 Hz
+            if self._tick % 15 == 0:
+                self.send_heartbeat()     # 2 Hz
     
     def on_camera_source_changed(self, slot_index: int, source_id: str):
         """Handle camera source selection"""
         widget = self.camera_grid.get_camera_widget(slot_index)
+        self._shown_frames.pop(slot_index, None)
         
         if source_id is None:
             # Close camera if open
-            if hasattr(widget, '_open_source_id') and widget._open_source_id:
+            if widget._open_source_id:
                 self.camera_manager.close_camera(widget._open_source_id)
                 widget._open_source_id = None
             return
         
         # Close previous source if different
-        if hasattr(widget, '_open_source_id') and widget._open_source_id:
+        if widget._open_source_id:
             if widget._open_source_id != source_id:
                 self.camera_manager.close_camera(widget._open_source_id)
         
@@ -190,10 +230,14 @@ class MainWindow(QMainWindow):
     def update_cameras(self):
         """Update all camera displays"""
         for widget in self.camera_grid.camera_widgets:
-            if hasattr(widget, '_open_source_id') and widget._open_source_id:
-                frame = self.camera_manager.read_frame(widget._open_source_id)
-                if frame is not None:
-                    widget.update_frame(frame)
+            sid = widget._open_source_id
+            if sid is None:
+                continue
+            frame = self.camera_manager.read_frame(sid)
+            # Same buffer as last tick: no new frame was decoded since
+            if frame is not None and self._shown_frames.get(widget.slot_index) != id(frame):
+                self._shown_frames[widget.slot_index] = id(frame)
+                widget.update_frame(frame)
         
     def load_vehicles(self):
         """Load available vehicles"""
@@ -211,18 +255,27 @@ class MainWindow(QMainWindow):
         self.connection_widget.set_connecting()
         self.status_bar.showMessage("Connecting...")
         
-        # Connect in background (should be threaded in production)
-        success = self.vehicle_manager.connect_vehicle(vehicle_id)
-        
+        # Connect in background so cameras and input stay live
+        QThreadPool.globalInstance().start(
+            _ConnectJob(self.vehicle_manager, vehicle_id, self.connect_done.emit)
+        )
+    
+    @pyqtSlot(str, bool)
+    def _on_connect_done(self, vehicle_id: str, success: bool):
+        """Handle connection result (UI thread)"""
         if success:
             conn_info = self.vehicle_manager.get_connection_info()
             info_text = f"{conn_info['type']}: {conn_info.get('port', conn_info.get('ip', ''))}"
             self.connection_widget.set_connected(True, info_text)
             self.status_bar.showMessage("Connected successfully", 3000)
             
-            # Start timers
-            self.telemetry_timer.start(100)   # 10 Hz telemetry
-            self.heartbeat_timer.start(500)   # 2 Hz heartbeat
+            # Resolve the heartbeat write once (serial adapters only)
+            adapter = self.vehicle_manager._adapters.get(self.vehicle_manager._active_vehicle_id)
+            serial_port = getattr(adapter, '_serial', None)
+            self._hb_write = serial_port.write if serial_port else None
+            
+            # Start telemetry and heartbeat on the UI tick
+            self._link_active = True
             
             logger.info(f"Connected to vehicle: {vehicle_id}")
         else:
@@ -233,9 +286,9 @@ class MainWindow(QMainWindow):
     
     def on_disconnect(self):
         """Handle disconnect button"""
-        # Stop timers first
-        self.telemetry_timer.stop()
-        self.heartbeat_timer.stop()
+        # Stop telemetry and heartbeat first
+        self._link_active = False
+        self._hb_write = None
         
         # Send neutral command before disconnect
         vehicle_id = self.vehicle_selector.get_selected_vehicle_id()
@@ -253,28 +306,29 @@ class MainWindow(QMainWindow):
         # Reset keyboard control
         self.current_dir = 1500
         self.current_thr = 1500
-        self.keys_pressed.clear()
+        self.keys_mask = 0
         self.manual_control_active = False
         
         logger.info("Disconnected")
     
     def send_heartbeat(self):
         """Send heartbeat to vehicle to maintain connection"""
-        if self.vehicle_manager.is_vehicle_connected():
-            # Envoie PING pour maintenir la connexion
-            try:
-                adapter = self.vehicle_manager._adapters.get(
-                    self.vehicle_manager._active_vehicle_id
-                )
-                if adapter and adapter._serial:
-                    adapter._serial.write(b"PING\n")
-            except:
-                pass  # Ignore errors
+        # Fast path: nothing to write to, or the adapter already saw the link drop
+        if self._hb_write is None or not self.vehicle_manager.is_vehicle_connected():
+            return
+        
+        # Envoie PING pour maintenir la connexion
+        try:
+            self._hb_write(b"PING\n")
+        except OSError as e:  # SerialException derives from OSError
+            # Tear the write down once instead of failing on every tick
+            self._hb_write = None
+            logger.warning(f"Heartbeat stopped: {e}")
     
     def update_telemetry(self):
         """Update telemetry display and send commands if needed"""
         # Receive telemetry
-        telem = self.vehicle_manager.receive_telemetry()
+        telem = self.vehicle_manager.drain_telemetry()
         if telem:
             self.telemetry_panel.update_telemetry(telem)
         
@@ -288,23 +342,25 @@ class MainWindow(QMainWindow):
     
     def keyPressEvent(self, event: QKeyEvent):
         """Handle keyboard press"""
-        key = event.key()
+        bit = KEY_BITS.get(event.key())
         
-        # Ignore if already pressed (auto-repeat)
-        if key in self.keys_pressed:
+        # Ignore non-control keys and auto-repeat
+        if bit is None or self.keys_mask & bit:
             return
         
-        self.keys_pressed.add(key)
+        self.keys_mask |= bit
         self.manual_control_active = True  # Activer contrôle manuel
         self.update_control_from_keyboard()
         
     def keyReleaseEvent(self, event: QKeyEvent):
         """Handle keyboard release"""
-        key = event.key()
-        self.keys_pressed.discard(key)
+        bit = KEY_BITS.get(event.key())
+        if bit is None:
+            return
+        self.keys_mask &= ~bit
         
         # Si plus aucune touche appuyée, retour neutre et désactiver contrôle
-        if not self.keys_pressed:
+        if not self.keys_mask:
             self.current_dir = 1500
             self.current_thr = 1500
             self.manual_control_active = False
@@ -313,31 +369,18 @@ class MainWindow(QMainWindow):
     
     def update_control_from_keyboard(self):
         """Update control values based on pressed keys"""
-        # Direction (Q = left, D = right)
-        if Qt.Key.Key_Q in self.keys_pressed:
-            self.current_dir = 1200  # Left
-        elif Qt.Key.Key_D in self.keys_pressed:
-            self.current_dir = 1800  # Right
-        else:
-            self.current_dir = 1500  # Center
-        
-        # Throttle (Z = forward, S = backward)
-        if Qt.Key.Key_Z in self.keys_pressed:
-            self.current_thr = 1700  # Forward
-        elif Qt.Key.Key_S in self.keys_pressed:
-            self.current_thr = 1300  # Backward
-        elif Qt.Key.Key_Space in self.keys_pressed:
-            self.current_thr = 1500  # Stop
-        else:
-            if Qt.Key.Key_Z not in self.keys_pressed and Qt.Key.Key_S not in self.keys_pressed:
-                self.current_thr = 1500  # Neutral
+        mask = self.keys_mask
+        
+        # Direction (Q = left, D = right, else center)
+        self.current_dir = 1200 if mask & BIT_Q else 1800 if mask & BIT_D else 1500
+        
+        # Throttle (Z = forward, S = backward, Space/none = stop)
+        self.current_thr = 1700 if mask & BIT_Z else 1300 if mask & BIT_S else 1500
     
     def closeEvent(self, event):
         """Handle window close"""
-        # Stop timers
-        self.telemetry_timer.stop()
-        self.camera_timer.stop()
-        self.heartbeat_timer.stop()
+        # Stop timer
+        self._tick_timer.stop()
         
         # Close all cameras
         self.camera_manager.close_all()
@@ -16,6 +16,9 @@ class CameraWidget(QFrame):
         super().__init__(parent)
         self.slot_index = slot_index
         self.current_source_id = None
+        self._open_source_id = None  # Source actually opened for this slot (set by MainWindow)
+        self._source_ids: tuple = ()  # Ids currently listed in the combo
+        self._images: dict = {}  # (address, shape) -> (buffer, QImage); buffers stay alive while wrapped
         self.setup_ui()
         
     def setup_ui(self):
@@ -54,19 +57,25 @@ class CameraWidget(QFrame):
         layout.addWidget(self.status_label)
     
     def set_available_sources(self, sources: list):
-        """Set available camera sources"""
-        current_text = self.source_combo.currentText()
+        """Set available camera sources (no-op if the list is unchanged)"""
+        new_ids = tuple(s.id for s in sources)
+        if new_ids == self._source_ids:
+            return
+        self._source_ids = new_ids
+        
+        current_id = self.source_combo.currentData()
         
         self.source_combo.blockSignals(True)
-        self.source_combo.clear()
-        self.source_combo.addItem("-- No feed --", None)
         
+        # Keep the "No feed" entry, replace the rest
+        model = self.source_combo.model()
+        model.removeRows(1, model.rowCount() - 1)
         for source in sources:
             display_text = f"{source.name} ({source.type})"
             self.source_combo.addItem(display_text, source.id)
         
         # Try to restore previous selection
-        idx = self.source_combo.findText(current_text)
+        idx = self.source_combo.findData(current_id)
         if idx >= 0:
             self.source_combo.setCurrentIndex(idx)
         
@@ -76,6 +85,7 @@ class CameraWidget(QFrame):
         """Handle source selection change"""
         source_id = self.source_combo.currentData()
         self.current_source_id = source_id
+        self._images.clear()
         
         if source_id is None:
             self.video_label.clear()
@@ -91,34 +101,34 @@ class CameraWidget(QFrame):
         if frame is None:
             return
         
-        # Convert BGR to RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
-        # Get widget size
-        widget_width = self.video_label.width()
-        widget_height = self.video_label.height()
-        
-        # Resize frame to fit (maintain aspect ratio)
-        h, w = rgb_frame.shape[:2]
-        aspect = w / h
-        
-        if widget_width / widget_height > aspect:
-            new_height = widget_height
-            new_width = int(new_height * aspect)
+        # Wrap the buffer directly (no colour conversion, no copy);
+        # mono sources stay 1 byte per pixel
+        if frame.ndim == 2:
+            fmt, ch = QImage.Format.Format_Grayscale8, 1
         else:
-            new_width = widget_width
-            new_height = int(new_width / aspect)
-        
-        # Resize
-        resized = cv2.resize(rgb_frame, (new_width, new_height))
-        
-        # Convert to QImage
-        h, w, ch = resized.shape
-        bytes_per_line = ch * w
-        q_img = QImage(resized.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-        
-        # Display
-        pixmap = QPixmap.fromImage(q_img)
+            fmt, ch = QImage.Format.Format_BGR888, 3
+        if frame.strides[-1] != 1 or frame.strides[1] != ch:
+            frame = np.ascontiguousarray(frame)
+        h, w = frame.shape[:2]
+        
+        # The capture thread decodes into the same buffers over and over,
+        # so each buffer's QImage wrapper is built once and reused
+        key = (frame.ctypes.data, frame.shape, frame.strides[0])
+        cached = self._images.get(key)
+        if cached is None:
+            if len(self._images) >= 4:  # Stream size changed: drop stale wrappers
+                self._images.clear()
+            q_img = QImage(frame.data, w, h, frame.strides[0], fmt)
+            self._images[key] = (frame, q_img)
+        else:
+            q_img = cached[1]
+        
+        # Let Qt scale to fit (maintain aspect ratio)
+        pixmap = QPixmap.fromImage(q_img).scaled(
+            self.video_label.size(),
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.FastTransformation
+        )
         self.video_label.setPixmap(pixmap)
         
         self.status_label.setText(f"Live • {w}x{h}")
@@ -163,8 +173,4 @@ class CameraGrid(QWidget):
         """Get camera widget by slot index"""
         if 0 <= slot_index < len(self.camera_widgets):
             return self.camera_widgets[slot_index]
-        return None
-
-
-# Import cv2 at module level
-import cv2
\ No newline at end of file
+        return None
\ No newline at end of file
@@ -50,38 +50,39 @@ class ConnectionWidget(QWidget):
         else:
             self.connect_clicked.emit()
     
+    @staticmethod
+    def _set_class(widget: QWidget, css_class: str):
+        """Switch QSS class, repolishing only if it actually changed"""
+        if widget.property("class") == css_class:
+            return
+        widget.setProperty("class", css_class)
+        
+        # Force style update
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+    
     def set_connected(self, connected: bool, info: str = ""):
         """Update connection state"""
         self._connected = connected
         
         if connected:
             self.status_label.setText("CONNECTED")
-            self.status_label.setProperty("class", "status-connected")
+            self._set_class(self.status_label, "status-connected")
             self.connect_btn.setText("Disconnect")
-            self.connect_btn.setProperty("class", "disconnect")
+            self._set_class(self.connect_btn, "disconnect")
             self.info_label.setText(info)
         else:
             self.status_label.setText("DISCONNECTED")
-            self.status_label.setProperty("class", "status-disconnected")
+            self._set_class(self.status_label, "status-disconnected")
             self.connect_btn.setText("Connect")
-            self.connect_btn.setProperty("class", "connect")
+            self._set_class(self.connect_btn, "connect")
             self.info_label.setText("")
-        
-        # Force style update
-        self.status_label.style().unpolish(self.status_label)
-        self.status_label.style().polish(self.status_label)
-        self.connect_btn.style().unpolish(self.connect_btn)
-        self.connect_btn.style().polish(self.connect_btn)
     
     def set_connecting(self):
         """Set connecting state"""
         self.status_label.setText("CONNECTING...")
-        self.status_label.setProperty("class", "status-warning")
+        self._set_class(self.status_label, "status-warning")
         self.connect_btn.setEnabled(False)
-        
-        # Force style update
-        self.status_label.style().unpolish(self.status_label)
-        self.status_label.style().polish(self.status_label)
     
     def enable_button(self, enabled: bool = True):
         """Enable/disable connect button"""
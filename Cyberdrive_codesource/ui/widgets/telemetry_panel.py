@@ -1,18 +1,34 @@
 """
 Telemetry panel widget - displays real-time vehicle data
 """
+from bisect import bisect_left, bisect_right
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                               QProgressBar, QFrame, QGridLayout)
 from PyQt6.QtCore import Qt, pyqtSlot
 from PyQt6.QtGui import QFont
 from core.telemetry import VehicleTelemetry
 
+# Battery range (LiPo 3S: 9.0 V - 12.6 V) as offset and percent-per-volt
+BATT_MIN, BATT_K = 9.0, (100.0 / 3.6)
+
 class TelemetryPanel(QWidget):
     """Widget displaying vehicle telemetry"""
     
+    # Color tables: index = number of thresholds passed
+    _DIST_THRESHOLDS = (20, 50)        # cm
+    _DIST_COLORS = ("#ff4444", "#ffaa00", "#00ff88")
+    _BATT_THRESHOLDS = (20, 50)        # %
+    _BATT_COLORS = ("#ff4444", "#ffaa00", "#00ff88")
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._reset_cache()
         self.setup_ui()
+    
+    def _reset_cache(self):
+        """Forget displayed values so the next update redraws everything"""
+        self._last = {'dir': None, 'thr': None, 'dist': None, 'batt': None, 'rx': None,
+                      'dist_color': None, 'batt_color': None}
         
     def setup_ui(self):
         """Setup user interface"""
@@ -103,58 +119,69 @@ class TelemetryPanel(QWidget):
     
     @pyqtSlot(object)
     def update_telemetry(self, telem: VehicleTelemetry):
-        """Update displayed telemetry data"""
+        """Update displayed telemetry data (only widgets whose value changed)"""
+        last = self._last
         
         # Direction
-        self.dir_value.setText(f"{telem.direction} µs")
+        if telem.direction != last['dir']:
+            last['dir'] = telem.direction
+            self.dir_value.setText(f"{telem.direction} µs")
         
         # Throttle
-        self.thr_value.setText(f"{telem.throttle} µs")
+        if telem.throttle != last['thr']:
+            last['thr'] = telem.throttle
+            self.thr_value.setText(f"{telem.throttle} µs")
         
         # Distance
-        if telem.distance_cm >= 0:
-            self.dist_value.setText(f"{telem.distance_cm} cm")
-            # Change color based on distance
-            if telem.distance_cm < 20:
-                self.dist_value.setStyleSheet("color: #ff4444;")
-            elif telem.distance_cm < 50:
-                self.dist_value.setStyleSheet("color: #ffaa00;")
+        if telem.distance_cm != last['dist']:
+            last['dist'] = telem.distance_cm
+            if telem.distance_cm >= 0:
+                self.dist_value.setText(f"{telem.distance_cm} cm")
+                # Change color based on distance
+                color = self._DIST_COLORS[bisect_right(self._DIST_THRESHOLDS, telem.distance_cm)]
             else:
-                self.dist_value.setStyleSheet("color: #00ff88;")
-        else:
-            self.dist_value.setText("-- cm")
-            self.dist_value.setStyleSheet("color: #a0a0a0;")
-        
-        # Battery
-        self.batt_value.setText(f"{telem.battery_voltage:.1f} V")
-        
-        # Battery percentage (assume 9V-12.6V range for LiPo 3S)
-        batt_percent = int(((telem.battery_voltage - 9.0) / 3.6) * 100)
-        batt_percent = max(0, min(100, batt_percent))
-        self.batt_bar.setValue(batt_percent)
-        
-        # Battery color
-        if batt_percent > 50:
-            self.batt_value.setStyleSheet("color: #00ff88;")
-        elif batt_percent > 20:
-            self.batt_value.setStyleSheet("color: #ffaa00;")
-        else:
-            self.batt_value.setStyleSheet("color: #ff4444;")
-        
-        # RX status
-        if telem.rx_active:
-            self.rx_status.setText("ACTIVE")
-            self.rx_status.setProperty("class", "status-connected")
-        else:
-            self.rx_status.setText("INACTIVE")
-            self.rx_status.setProperty("class", "status-disconnected")
-        
-        # Force style update
-        self.rx_status.style().unpolish(self.rx_status)
-        self.rx_status.style().polish(self.rx_status)
+                self.dist_value.setText("-- cm")
+                color = "#a0a0a0"
+            
+            if color != last['dist_color']:
+                last['dist_color'] = color
+                self.dist_value.setStyleSheet(f"color: {color};")
+        
+        # Battery (compared at display precision)
+        voltage = round(telem.battery_voltage, 1)
+        if voltage != last['batt']:
+            last['batt'] = voltage
+            self.batt_value.setText(f"{voltage:.1f} V")
+            
+            # Battery percentage
+            batt_percent = int((telem.battery_voltage - BATT_MIN) * BATT_K)  # Unrounded voltage
+            batt_percent = 0 if batt_percent < 0 else 100 if batt_percent > 100 else batt_percent
+            self.batt_bar.setValue(batt_percent)
+            
+            # Battery color
+            color = self._BATT_COLORS[bisect_left(self._BATT_THRESHOLDS, batt_percent)]
+            
+            if color != last['batt_color']:
+                last['batt_color'] = color
+                self.batt_value.setStyleSheet(f"color: {color};")
+        
+        # RX status (repolish only when the class changes)
+        if telem.rx_active != last['rx']:
+            last['rx'] = telem.rx_active
+            if telem.rx_active:
+                self.rx_status.setText("ACTIVE")
+                self.rx_status.setProperty("class", "status-connected")
+            else:
+                self.rx_status.setText("INACTIVE")
+                self.rx_status.setProperty("class", "status-disconnected")
+            
+            # Force style update
+            self.rx_status.style().unpolish(self.rx_status)
+            self.rx_status.style().polish(self.rx_status)
     
     def clear(self):
         """Clear all telemetry values"""
+        self._reset_cache()
         self.dir_value.setText("-- µs")
         self.thr_value.setText("-- µs")
         self.dist_value.setText("-- cm")
@@ -3,7 +3,7 @@ Vehicle selector widget
 """
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QComboBox
 from PyQt6.QtCore import Qt, pyqtSignal
-from typing import List
+from typing import Dict, List
 from vehicle.vehicle_profile import VehicleProfile
 
 class VehicleSelector(QWidget):
@@ -15,6 +15,9 @@ class VehicleSelector(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._vehicles: List[VehicleProfile] = []
+        self._by_id: Dict[str, VehicleProfile] = {}
+        self._display_cache: List[str] = []  # Combo text per vehicle
+        self._info_cache: List[str] = []     # Info label text per vehicle
         self.setup_ui()
         
     def setup_ui(self):
@@ -30,6 +33,8 @@ class VehicleSelector(QWidget):
         
         # ComboBox
         self.combo = QComboBox()
+        self.combo.setSizeAdjustPolicy(QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon)
+        self.combo.setMinimumContentsLength(24)
         self.combo.currentIndexChanged.connect(self._on_selection_changed)
         layout.addWidget(self.combo)
         
@@ -42,14 +47,20 @@ class VehicleSelector(QWidget):
     def set_vehicles(self, vehicles: List[VehicleProfile]):
         """Set available vehicles"""
         self._vehicles = vehicles
-        self.combo.clear()
+        self._by_id = {v.id: v for v in vehicles}
+        self._display_cache = [f"{v.name} ({v.type})" for v in vehicles]
+        self._info_cache = [self._format_info(v) for v in vehicles]
         
-        for vehicle in vehicles:
-            display_text = f"{vehicle.name} ({vehicle.type})"
-            self.combo.addItem(display_text, vehicle.id)
+        # Fill in one batch; selection is announced once at the end
+        self.combo.blockSignals(True)
+        self.combo.clear()
+        self.combo.addItems(self._display_cache)
+        for i, vehicle in enumerate(vehicles):
+            self.combo.setItemData(i, vehicle.id)
+        self.combo.blockSignals(False)
         
         if vehicles:
-            self._update_info(0)
+            self._on_selection_changed(self.combo.currentIndex())
     
     def get_selected_vehicle_id(self) -> str:
         """Get currently selected vehicle ID"""
@@ -57,11 +68,7 @@ class VehicleSelector(QWidget):
     
     def get_selected_vehicle(self) -> VehicleProfile:
         """Get currently selected vehicle profile"""
-        vehicle_id = self.get_selected_vehicle_id()
-        for vehicle in self._vehicles:
-            if vehicle.id == vehicle_id:
-                return vehicle
-        return None
+        return self._by_id.get(self.combo.currentData())
     
     def _on_selection_changed(self, index: int):
         """Handle selection change"""
@@ -72,11 +79,15 @@ class VehicleSelector(QWidget):
     
     def _update_info(self, index: int):
         """Update info label with vehicle details"""
-        if index < 0 or index >= len(self._vehicles):
+        if index < 0 or index >= len(self._info_cache):
             self.info_label.setText("")
             return
         
-        vehicle = self._vehicles[index]
+        self.info_label.setText(self._info_cache[index])
+    
+    @staticmethod
+    def _format_info(vehicle: VehicleProfile) -> str:
+        """Build the info label text for a vehicle"""
         conn = vehicle.connection
         
         info_parts = []
@@ -88,4 +99,4 @@ class VehicleSelector(QWidget):
         elif conn.preferred_mode == "wifi":
             info_parts.append(f"Connection: WiFi ({conn.wifi_ip}:{conn.wifi_port})")
         
-        self.info_label.setText(" | ".join(info_parts))
\ No newline at end of file
+        return " | ".join(info_parts)
\ No newline at end of file
@@ -3,12 +3,83 @@ Configuration loader for YAML and JSON files
 """
 import yaml
 import json
+import os
+import pickle
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Callable
+
+# libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# Optional fast JSON (fallback: stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+_MISSING = object()
+
+@lru_cache(maxsize=512)
+def _split_path(path: str) -> tuple:
+    """Split a dotted config path once per distinct string"""
+    return tuple(path.split('.'))
 
 class ConfigLoader:
     """Load and manage configuration files"""
     
+    @staticmethod
+    def _load_cached(file_path: str | Path, parse: Callable[[bytes], Any]) -> Any:
+        """
+        Parse a config file, reusing the pickled result from a
+        '<file>.pkl' sidecar while the source is unchanged
+        
+        Args:
+            file_path: Source file
+            parse: Parser taking the raw file bytes
+            
+        Returns:
+            Parsed data
+        """
+        path = os.fspath(file_path)
+        
+        # One open (no separate exists/stat): fstat gives the cache stamp
+        try:
+            src = open(path, 'rb')
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {path}") from None
+        
+        with src:
+            st = os.fstat(src.fileno())
+            stamp = (st.st_mtime_ns, st.st_size)
+            cache = path + '.pkl'
+            
+            try:
+                with open(cache, 'rb') as f:
+                    cached_stamp, data = pickle.load(f)
+                if cached_stamp == stamp:
+                    return data
+            except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+                pass  # Missing or unreadable cache: parse the source
+            
+            data = parse(src.read())
+        
+        # Best effort: a read-only config dir just means no cache
+        tmp = cache + '.tmp'
+        try:
+            with open(tmp, 'wb') as f:
+                pickle.dump((stamp, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache)
+        except OSError:
+            pass
+        
+        return data
+    
     @staticmethod
     def load_yaml(file_path: str | Path) -> Dict[str, Any]:
         """
@@ -20,12 +91,8 @@ class ConfigLoader:
         Returns:
             Configuration dictionary
         """
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Config file not found: {path}")
-        
-        with open(path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        # Bytes straight to the parser (it detects the encoding itself)
+        config = ConfigLoader._load_cached(file_path, lambda raw: yaml.load(raw, Loader=SafeLoader))
         
         return config or {}
     
@@ -40,12 +107,7 @@ class ConfigLoader:
         Returns:
             Configuration dictionary
         """
-        path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Config file not found: {path}")
-        
-        with open(path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = ConfigLoader._load_cached(file_path, _json_loads)
         
         return config
     
@@ -56,16 +118,25 @@ class ConfigLoader:
         path.parent.mkdir(parents=True, exist_ok=True)
         
         with open(path, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(data, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
     
     @staticmethod
     def save_json(data: Dict[str, Any], file_path: str | Path, indent: int = 2):
-        """Save data to JSON file"""
+        """Save data to JSON file (atomically replaced)"""
         path = Path(file_path)
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent)
+        # orjson only knows compact and 2-space output
+        if orjson is not None and indent in (None, 2):
+            raw = orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        else:
+            separators = (',', ':') if indent is None else None  # Compact like orjson
+            raw = json.dumps(data, indent=indent, separators=separators).encode('utf-8')
+        
+        # One write to a temp file, then rename: readers never see a partial file
+        tmp = path.with_name(path.name + '.tmp')
+        tmp.write_bytes(raw)
+        os.replace(tmp, path)
 
     @staticmethod
     def get_value(config: Dict[str, Any], path: str, default: Any = None) -> Any:
@@ -76,13 +147,11 @@ class ConfigLoader:
             config = {'server': {'name': 'RC Car'}}
             get_value(config, 'server.name') -> 'RC Car'
         """
-        keys = path.split('.')
         value = config
         
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
+        for key in _split_path(path):
+            value = value.get(key, _MISSING) if type(value) is dict else _MISSING
+            if value is _MISSING:
                 return default
         
         return value
\ No newline at end of file
@@ -1,9 +1,12 @@
 """
 Logging utility with colored console output
 """
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-from typing import Optional
+from typing import Dict, Optional
 from colorama import init, Fore, Style
 
 # Initialize colorama for Windows
@@ -20,11 +23,33 @@ class ColoredFormatter(logging.Formatter):
         'CRITICAL': Fore.RED + Style.BRIGHT,
     }
     
+    # Fully colored level names, built once
+    _COLORED_LEVELS = {lvl: f"{col}{lvl}{Style.RESET_ALL}" for lvl, col in COLORS.items()}
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._colored_names: Dict[str, str] = {}  # logger name -> colored name
+    
     def format(self, record):
-        color = self.COLORS.get(record.levelname, '')
-        record.levelname = f"{color}{record.levelname}{Style.RESET_ALL}"
-        record.name = f"{Fore.MAGENTA}{record.name}{Style.RESET_ALL}"
-        return super().format(record)
+        levelname, name = record.levelname, record.name
+        
+        colored_name = self._colored_names.get(name)
+        if colored_name is None:
+            colored_name = self._colored_names[name] = f"{Fore.MAGENTA}{name}{Style.RESET_ALL}"
+        
+        record.levelname = self._COLORED_LEVELS.get(levelname, levelname)
+        record.name = colored_name
+        try:
+            return super().format(record)
+        finally:
+            # Other handlers (file) see the same record: restore plain values
+            record.levelname, record.name = levelname, name
+
+# Records buffered before a file write (ERROR and above flush immediately)
+FILE_BUFFER_RECORDS = 256
+
+# Background listeners doing the actual handler I/O, one per logger name
+_listeners: Dict[str, logging.handlers.QueueListener] = {}
 
 def setup_logger(
     name: str,
@@ -34,6 +59,7 @@ def setup_logger(
 ) -> logging.Logger:
     """
     Setup a logger with optional console and file output
+    Records are queued; a listener thread formats and writes them
     
     Args:
         name: Logger name
@@ -49,6 +75,11 @@ def setup_logger(
     
     # Clear existing handlers
     logger.handlers.clear()
+    previous = _listeners.pop(name, None)
+    if previous:
+        _stop_listener(previous)
+    
+    handlers = []
     
     # Console handler
     if console:
@@ -59,7 +90,7 @@ def setup_logger(
             datefmt='%H:%M:%S'
         )
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
     
     # File handler
     if file_path:
@@ -72,10 +103,38 @@ def setup_logger(
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        
+        # Coalesce file writes
+        handlers.append(logging.handlers.MemoryHandler(
+            capacity=FILE_BUFFER_RECORDS,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        ))
+    
+    # Callers only enqueue; console/file writes happen on the listener thread
+    if handlers:
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _listeners[name] = listener
     
     return logger
 
+def _stop_listener(listener: logging.handlers.QueueListener):
+    """Drain a listener's queue, then flush buffered file records"""
+    listener.stop()
+    for handler in listener.handlers:
+        handler.flush()
+
+@atexit.register
+def _stop_listeners():
+    """Flush queued records before the interpreter exits"""
+    for listener in _listeners.values():
+        _stop_listener(listener)
+    _listeners.clear()
+
 # Global logger instance
 _global_logger: Optional[logging.Logger] = None
 
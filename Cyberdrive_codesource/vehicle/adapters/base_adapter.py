@@ -58,6 +58,16 @@ class BaseAdapter(ABC):
         """
         pass
     
+    def drain_telemetry(self) -> Optional[VehicleTelemetry]:
+        """
+        Consume all pending data and return only the newest telemetry
+        Adapters override this to skip parsing stale frames
+        
+        Returns:
+            Most recent VehicleTelemetry or None if no data
+        """
+        return self.receive_telemetry()
+    
     @property
     def is_connected(self) -> bool:
         """Check if adapter is connected"""
@@ -1,10 +1,13 @@
 """
 Serial (COM port) adapter for vehicle communication
 """
+import logging
+import re
 import serial
 import serial.tools.list_ports
 from typing import Optional, List
 import sys
+import threading
 from pathlib import Path
 
 # Add project root to path
@@ -18,9 +21,22 @@ from utils.logger import get_logger
 
 logger = get_logger()
 
+# Drop a partial line that grows past this (noise without newlines)
+MAX_LINE_BYTES = 4096
+
 class SerialAdapter(BaseAdapter):
     """Serial communication adapter (USB/COM port)"""
     
+    # Common ESP32 USB bridge identifiers, matched case-insensitively in one pass
+    _ESP32_RE = re.compile(
+        r"CP210"          # CP2102 USB bridge (common on ESP32)
+        r"|CH340"         # CH340 USB bridge
+        r"|FTDI"          # FTDI chips
+        r"|USB-SERIAL"
+        r"|Silicon Labs",
+        re.IGNORECASE
+    )
+    
     def __init__(self, port: str = "AUTO", baudrate: int = 115200, timeout: float = 1.0):
         """
         Initialize serial adapter
@@ -35,6 +51,16 @@ class SerialAdapter(BaseAdapter):
         self._baudrate = baudrate
         self._timeout = timeout
         self._serial: Optional[serial.Serial] = None
+        self._reader: Optional[threading.Thread] = None
+        self._reader_stop = threading.Event()
+        self._line_lock = threading.Lock()  # Guards _pending_payload
+        self._pending_payload: Optional[str] = None  # Newest unparsed TELEM payload
+        self._dbg = False  # Debug logging enabled (refreshed on connect)
+        
+        # Bound logger methods for the send/receive paths
+        self._log_debug = logger.debug
+        self._log_warn = logger.warning
+        self._log_error = logger.error
     
     @staticmethod
     def list_available_ports() -> List[str]:
@@ -57,21 +83,10 @@ class SerialAdapter(BaseAdapter):
         """
         ports = serial.tools.list_ports.comports()
         
-        # Common ESP32 identifiers
-        esp32_identifiers = [
-            "CP210",  # CP2102 USB bridge (common on ESP32)
-            "CH340",  # CH340 USB bridge
-            "FTDI",   # FTDI chips
-            "USB-SERIAL",
-            "Silicon Labs"
-        ]
-        
         for port in ports:
-            description = port.description.upper()
-            for identifier in esp32_identifiers:
-                if identifier.upper() in description:
-                    logger.info(f"Detected potential ESP32 on {port.device}: {port.description}")
-                    return port.device
+            if SerialAdapter._ESP32_RE.search(port.description):
+                logger.info(f"Detected potential ESP32 on {port.device}: {port.description}")
+                return port.device
         
         return None
     
@@ -106,6 +121,19 @@ class SerialAdapter(BaseAdapter):
             self._serial.reset_output_buffer()
             
             self._connected = True
+            self._dbg = logger.isEnabledFor(logging.DEBUG)
+            
+            # Drain the port continuously so the input buffer never backs up
+            self._pending_payload = None
+            self._reader_stop = threading.Event()
+            self._reader = threading.Thread(
+                target=self._read_loop,
+                args=(self._serial, self._reader_stop),
+                name=f"serial-reader-{self._port}",
+                daemon=True
+            )
+            self._reader.start()
+            
             logger.info(f"✓ Connected to {self._port} at {self._baudrate} baud")
             return True
             
@@ -116,6 +144,12 @@ class SerialAdapter(BaseAdapter):
     
     def disconnect(self):
         """Disconnect from serial port"""
+        if self._reader:
+            self._reader_stop.set()
+            self._serial.cancel_read()
+            self._reader.join(timeout=self._timeout + 0.5)
+            self._reader = None
+        
         if self._serial and self._serial.is_open:
             self._serial.close()
             self._connected = False
@@ -124,57 +158,95 @@ class SerialAdapter(BaseAdapter):
     def send_command(self, command: VehicleCommand) -> bool:
         """Send command to vehicle via serial"""
         if not self._connected or not self._serial:
-            logger.warning("Cannot send command: not connected")
+            self._log_warn("Cannot send command: not connected")
             return False
         
         try:
-            cmd_str = command.to_esp32_string()
-            self._serial.write(cmd_str.encode('utf-8'))
-            logger.debug(f"→ Sent: {cmd_str.strip()}")
+            self._serial.write(command.to_esp32_bytes())
+            self._log_debug("→ Sent: %s", command)
             return True
             
         except serial.SerialException as e:
-            logger.error(f"Failed to send command: {e}")
+            self._log_error(f"Failed to send command: {e}")
             self._connected = False
             return False
     
-    def receive_telemetry(self) -> Optional[VehicleTelemetry]:
-        """Receive telemetry from vehicle via serial"""
-        if not self._connected or not self._serial:
-            return None
+    def _read_loop(self, port: serial.Serial, stop: threading.Event):
+        """Reader thread: keep only the newest TELEM line, log the rest"""
+        buf = bytearray()
         
-        try:
-            if self._serial.in_waiting > 0:
-                line = self._serial.readline().decode('utf-8', errors='ignore').strip()
-                
+        while not stop.is_set():
+            try:
+                # Block for the first byte, then take everything already received
+                chunk = port.read(port.in_waiting or 1)
+            except (serial.SerialException, OSError, TypeError) as e:
+                # TypeError: pyserial raises it when the port is closed mid-read
+                if not stop.is_set():
+                    self._log_error(f"Serial read error: {e}")
+                    self._connected = False
+                return
+            
+            if not chunk:
+                continue
+            buf += chunk
+            
+            # Split complete lines; keep the trailing partial one
+            start = 0
+            while (end := buf.find(b'\n', start)) >= 0:
+                line = buf[start:end].decode('utf-8', errors='ignore').strip()
+                start = end + 1
                 if line:
-                    # ===== DEBUG =====
-                    print(f"DEBUG RAW: {line}")
-                    # =================
-                    
-                    logger.debug(f"← Received: {line}")
-                    
-                    # Parse telemetry
-                    if line.startswith("TELEM:"):
-                        try:
-                            telem = VehicleTelemetry.from_esp32_string(line)
-                            self._last_telemetry = telem
-                            return telem
-                        except ValueError as e:
-                            logger.warning(f"Invalid telemetry: {e}")
-                    
-                    # Handle other messages
-                    elif line.startswith("ACK:") or line.startswith("HEARTBEAT:"):
-                        logger.debug(f"Device message: {line}")
+                    self._handle_line(line)
+            del buf[:start]
             
+            if len(buf) > MAX_LINE_BYTES:
+                buf.clear()
+    
+    def _handle_line(self, line: str):
+        """Log and dispatch one received line"""
+        if self._dbg:
+            self._log_debug("← Received: %s", line)
+        
+        # Single scan: the first ':' gives both the kind and the payload start
+        idx = line.find(':')
+        handler = self._PREFIX_HANDLERS.get(line[:idx]) if idx > 0 else None
+        if handler:
+            handler(self, line, idx)
+    
+    def _on_telem(self, line: str, idx: int):
+        """Keep the newest TELEM payload (older frames are dropped unparsed)"""
+        payload = line[idx + 1:]
+        with self._line_lock:
+            self._pending_payload = payload
+    
+    def _on_device_message(self, line: str, idx: int):
+        """Handle other messages"""
+        if self._dbg:
+            self._log_debug("Device message: %s", line)
+    
+    _PREFIX_HANDLERS = {
+        "TELEM": _on_telem,
+        "ACK": _on_device_message,
+        "HEARTBEAT": _on_device_message,
+    }
+    
+    def receive_telemetry(self) -> Optional[VehicleTelemetry]:
+        """Return the newest telemetry read since the last call (non-blocking)"""
+        if not self._connected or not self._serial:
             return None
-            
-        except serial.SerialException as e:
-            logger.error(f"Serial read error: {e}")
-            self._connected = False
+        
+        with self._line_lock:
+            payload, self._pending_payload = self._pending_payload, None
+        
+        if payload is None:
             return None
-        except UnicodeDecodeError:
-            # Ignore corrupted data
+        
+        try:
+            telem = VehicleTelemetry.from_fields(payload.split(':'))
+            self._last_telemetry = telem
+            return telem
+        except ValueError as e:
+            self._log_warn(f"Invalid telemetry: {e}")
             return None
     
     def get_connection_info(self) -> dict:
@@ -1,6 +1,7 @@
 """
 WiFi/TCP adapter for vehicle communication
 """
+import logging
 import socket
 from typing import Optional
 from .base_adapter import BaseAdapter
@@ -9,6 +10,9 @@ from utils.logger import get_logger
 
 logger = get_logger()
 
+# Bytes requested per recv() call
+RECV_SIZE = 4096
+
 class WiFiAdapter(BaseAdapter):
     """WiFi/TCP communication adapter"""
     
@@ -26,7 +30,15 @@ class WiFiAdapter(BaseAdapter):
         self._port = port
         self._timeout = timeout
         self._socket: Optional[socket.socket] = None
-        self._buffer = ""
+        self._buffer = bytearray()  # Received bytes not yet split into lines
+        self._recv_buf = bytearray(RECV_SIZE)  # Reused by recv_into
+        self._recv_mv = memoryview(self._recv_buf)
+        self._dbg = False  # Debug logging enabled (refreshed on connect)
+        
+        # Bound logger methods for the send/receive paths
+        self._log_debug = logger.debug
+        self._log_warn = logger.warning
+        self._log_error = logger.error
     
     def connect(self) -> bool:
         """Connect to vehicle via TCP"""
@@ -39,6 +51,7 @@ class WiFiAdapter(BaseAdapter):
             self._socket.setblocking(False)
             
             self._connected = True
+            self._dbg = logger.isEnabledFor(logging.DEBUG)
             logger.info(f"✓ Connected to {self._ip}:{self._port} via WiFi")
             return True
             
@@ -65,17 +78,16 @@ class WiFiAdapter(BaseAdapter):
     def send_command(self, command: VehicleCommand) -> bool:
         """Send command to vehicle via WiFi"""
         if not self._connected or not self._socket:
-            logger.warning("Cannot send command: not connected")
+            self._log_warn("Cannot send command: not connected")
             return False
         
         try:
-            cmd_str = command.to_esp32_string()
-            self._socket.sendall(cmd_str.encode('utf-8'))
-            logger.debug(f"→ Sent: {cmd_str.strip()}")
+            self._socket.sendall(command.to_esp32_bytes())
+            self._log_debug("→ Sent: %s", command)
             return True
             
         except socket.error as e:
-            logger.error(f"Failed to send command: {e}")
+            self._log_error(f"Failed to send command: {e}")
             self._connected = False
             return False
     
@@ -85,33 +97,38 @@ class WiFiAdapter(BaseAdapter):
             return None
         
         try:
-            # Non-blocking receive
-            data = self._socket.recv(1024).decode('utf-8', errors='ignore')
+            # Non-blocking receive into the reusable buffer
+            n = self._socket.recv_into(self._recv_mv)
             
-            if data:
+            if not n:
+                # EOF: the vehicle closed the connection
+                self._log_warn("Connection closed by vehicle")
+                self._connected = False
+            else:
                 # Add to buffer
-                self._buffer += data
+                buf = self._buffer
+                buf += self._recv_mv[:n]
                 
-                # Process complete lines
-                while '\n' in self._buffer:
-                    line, self._buffer = self._buffer.split('\n', 1)
-                    line = line.strip()
-                    
-                    if line:
-                        logger.debug(f"← Received: {line}")
-                        
-                        # Parse telemetry
-                        if line.startswith("TELEM:"):
-                            try:
-                                telem = VehicleTelemetry.from_esp32_string(line)
-                                self._last_telemetry = telem
-                                return telem
-                            except ValueError as e:
-                                logger.warning(f"Invalid telemetry: {e}")
+                # Process complete lines, decoding each once
+                start = 0
+                try:
+                    while (end := buf.find(b'\n', start)) >= 0:
+                        line = buf[start:end].decode('utf-8', errors='ignore').strip()
+                        start = end + 1
                         
-                        # Handle other messages
-                        elif line.startswith("ACK:") or line.startswith("HEARTBEAT:"):
-                            logger.debug(f"Device message: {line}")
+                        if line:
+                            if self._dbg:
+                                self._log_debug("← Received: %s", line)
+                            
+                            # Single scan: the first ':' gives both the kind and the payload start
+                            idx = line.find(':')
+                            handler = self._PREFIX_HANDLERS.get(line[:idx]) if idx > 0 else None
+                            if handler:
+                                telem = handler(self, line, idx)
+                                if telem is not None:
+                                    return telem
+                finally:
+                    del buf[:start]  # Keep unprocessed lines for the next call
             
             return None
             
@@ -119,10 +136,78 @@ class WiFiAdapter(BaseAdapter):
             # No data available (normal for non-blocking socket)
             return None
         except socket.error as e:
-            logger.error(f"Socket error: {e}")
+            self._log_error(f"Socket error: {e}")
             self._connected = False
             return None
     
+    def _on_telem(self, line: str, idx: int) -> Optional[VehicleTelemetry]:
+        """Parse telemetry from the payload fields"""
+        try:
+            telem = VehicleTelemetry.from_fields(line[idx + 1:].split(':'))
+            self._last_telemetry = telem
+            return telem
+        except ValueError as e:
+            self._log_warn(f"Invalid telemetry: {e}")
+            return None
+    
+    def _on_device_message(self, line: str, idx: int) -> None:
+        """Handle other messages"""
+        if self._dbg:
+            self._log_debug("Device message: %s", line)
+    
+    _PREFIX_HANDLERS = {
+        "TELEM": _on_telem,
+        "ACK": _on_device_message,
+        "HEARTBEAT": _on_device_message,
+    }
+    
+    def drain_telemetry(self) -> Optional[VehicleTelemetry]:
+        """Read everything available on the socket, parse only the newest telemetry frame"""
+        if not self._connected or not self._socket:
+            return None
+        
+        try:
+            while True:
+                n = self._socket.recv_into(self._recv_mv)
+                if not n:
+                    # EOF: the vehicle closed the connection
+                    self._log_warn("Connection closed by vehicle")
+                    self._connected = False
+                    break
+                self._buffer += self._recv_mv[:n]
+        except BlockingIOError:
+            # Socket drained
+            pass
+        except socket.error as e:
+            self._log_error(f"Socket error: {e}")
+            self._connected = False
+            return None
+        
+        # Keep the trailing partial line in the buffer
+        end = self._buffer.rfind(b'\n')
+        if end < 0:
+            return None
+        lines = self._buffer[:end].split(b'\n')
+        del self._buffer[:end + 1]
+        
+        latest = None
+        for line in lines:
+            line = line.strip()
+            if line.startswith(b"TELEM:"):
+                latest = line  # Older frames are dropped undecoded
+            elif line and self._dbg:
+                self._log_debug("Device message: %s", line.decode('utf-8', errors='ignore'))
+        
+        if latest:
+            try:
+                telem = VehicleTelemetry.from_esp32_string(latest.decode('utf-8', errors='ignore'))
+                self._last_telemetry = telem
+                return telem
+            except ValueError as e:
+                self._log_warn(f"Invalid telemetry: {e}")
+        
+        return None
+    
     def get_connection_info(self) -> dict:
         """Get connection information"""
         info = super().get_connection_info()
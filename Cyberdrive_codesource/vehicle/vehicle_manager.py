@@ -1,7 +1,9 @@
 """
 Vehicle manager - handles multiple vehicles and their connections
 """
-from typing import Optional, List, Dict
+import selectors
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Iterator
 from pathlib import Path
 from .vehicle_profile import VehicleProfile
 from .adapters.base_adapter import BaseAdapter
@@ -12,13 +14,20 @@ from utils.logger import get_logger
 
 logger = get_logger()
 
+# Threads used to parse profile files in parallel (I/O bound)
+PROFILE_LOAD_WORKERS = 8
+
 class VehicleManager:
     """Manage multiple vehicles and their connections"""
     
     def __init__(self):
         self._vehicles: Dict[str, VehicleProfile] = {}
+        self._vehicle_paths: Dict[str, Path] = {}  # file stem -> profile not parsed yet
         self._adapters: Dict[str, BaseAdapter] = {}
         self._active_vehicle_id: Optional[str] = None
+        # WiFi sockets are watched for readability instead of being polled
+        self._selector = selectors.DefaultSelector()
+        self._selected: Dict[str, object] = {}  # vehicle id -> registered socket
     
     def load_vehicle_profiles(self, config_dir: str | Path):
         """
@@ -33,22 +42,64 @@ class VehicleManager:
             logger.warning(f"Vehicle config directory not found: {config_path}")
             return
         
-        # Load all JSON files
+        # Index JSON files only; profiles are parsed on first access
         for json_file in config_path.glob("*.json"):
-            try:
-                profile = VehicleProfile.from_json_file(json_file)
-                self._vehicles[profile.id] = profile
-                logger.info(f"Loaded vehicle profile: {profile.name} ({profile.id})")
-            except Exception as e:
-                logger.error(f"Failed to load {json_file}: {e}")
+            self._vehicle_paths[json_file.stem] = json_file
+        
+        logger.info(f"Found {len(self._vehicle_paths)} vehicle profile file(s)")
+    
+    @staticmethod
+    def _parse_profile(json_file: Path) -> Optional[VehicleProfile]:
+        """Parse one profile file, logging instead of raising on error"""
+        try:
+            return VehicleProfile.from_json_file(json_file)
+        except Exception as e:
+            logger.error(f"Failed to load {json_file}: {e}")
+            return None
+    
+    def _register_profile(self, profile: Optional[VehicleProfile]) -> Optional[VehicleProfile]:
+        """Register a parsed profile by its id"""
+        if profile is not None:
+            self._vehicles[profile.id] = profile
+            logger.info(f"Loaded vehicle profile: {profile.name} ({profile.id})")
+        return profile
+    
+    def _load_profile(self, key: str) -> Optional[VehicleProfile]:
+        """Parse one indexed profile file and register it by its id"""
+        return self._register_profile(self._parse_profile(self._vehicle_paths.pop(key)))
+    
+    def _load_all_profiles(self):
+        """Parse every pending profile file, in parallel when there are several"""
+        paths = list(self._vehicle_paths.values())
+        self._vehicle_paths.clear()
+        if len(paths) <= 1:
+            profiles = [self._parse_profile(p) for p in paths]
+        else:
+            with ThreadPoolExecutor(max_workers=min(PROFILE_LOAD_WORKERS, len(paths))) as pool:
+                profiles = list(pool.map(self._parse_profile, paths))
+        # Registered on this thread, in file order
+        for profile in profiles:
+            self._register_profile(profile)
     
     def get_vehicle_list(self) -> List[VehicleProfile]:
-        """Get list of all loaded vehicles"""
+        """Get list of all vehicles (parses any profile not loaded yet)"""
+        if self._vehicle_paths:
+            self._load_all_profiles()
         return list(self._vehicles.values())
     
     def get_vehicle(self, vehicle_id: str) -> Optional[VehicleProfile]:
-        """Get vehicle profile by ID"""
-        return self._vehicles.get(vehicle_id)
+        """Get vehicle profile by ID, parsing its file on first access"""
+        vehicle = self._vehicles.get(vehicle_id)
+        if vehicle is None and self._vehicle_paths:
+            # Files are usually named after the id; otherwise parse until found
+            if vehicle_id in self._vehicle_paths:
+                self._load_profile(vehicle_id)
+            for key in list(self._vehicle_paths):
+                if vehicle_id in self._vehicles:
+                    break
+                self._load_profile(key)
+            vehicle = self._vehicles.get(vehicle_id)
+        return vehicle
     
     def connect_vehicle(self, vehicle_id: str) -> bool:
         """
@@ -60,7 +111,7 @@ class VehicleManager:
         Returns:
             True if connection successful
         """
-        vehicle = self._vehicles.get(vehicle_id)
+        vehicle = self.get_vehicle(vehicle_id)
         if not vehicle:
             logger.error(f"Vehicle not found: {vehicle_id}")
             return False
@@ -91,6 +142,9 @@ class VehicleManager:
         if adapter.connect():
             self._adapters[vehicle_id] = adapter
             self._active_vehicle_id = vehicle_id
+            if isinstance(adapter, WiFiAdapter):
+                self._selector.register(adapter._socket, selectors.EVENT_READ, adapter)
+                self._selected[vehicle_id] = adapter._socket
             logger.info(f"✓ Vehicle connected: {vehicle.name}")
             return True
         else:
@@ -101,6 +155,10 @@ class VehicleManager:
         """Disconnect a vehicle"""
         adapter = self._adapters.get(vehicle_id)
         if adapter:
+            sock = self._selected.pop(vehicle_id, None)
+            if sock is not None:
+                # Before disconnect() so the socket is still open
+                self._selector.unregister(sock)
             adapter.disconnect()
             del self._adapters[vehicle_id]
             
@@ -160,6 +218,60 @@ class VehicleManager:
         
         return None
     
+    def drain_telemetry(self, vehicle_id: Optional[str] = None) -> Optional[VehicleTelemetry]:
+        """
+        Drain pending telemetry from vehicle, keeping only the newest
+        
+        Args:
+            vehicle_id: Target vehicle ID (uses active if None)
+            
+        Returns:
+            Most recent VehicleTelemetry or None
+        """
+        target_id = vehicle_id or self._active_vehicle_id
+        
+        if not target_id:
+            return None
+        
+        adapter = self._adapters.get(target_id)
+        if adapter:
+            return adapter.drain_telemetry()
+        
+        return None
+    
+    def poll_telemetry(self, timeout: Optional[float] = 0.01) -> Iterator[VehicleTelemetry]:
+        """
+        Wait for WiFi vehicles with pending data and drain their telemetry
+        
+        Opt-in API for a dedicated polling loop (not used by the UI, which
+        drains the active vehicle on its own timer). Serial adapters have
+        their own reader thread and are not selected; use drain_telemetry()
+        for them.
+        
+        Args:
+            timeout: Max seconds to block (0 = don't block, None = forever)
+            
+        Yields:
+            Most recent VehicleTelemetry of each ready vehicle
+        """
+        if not self._selected:
+            return
+        for key, _ in self._selector.select(timeout):
+            adapter = key.data
+            telemetry = adapter.drain_telemetry()
+            if not adapter.is_connected:
+                # Socket error or EOF: a dead socket stays readable, stop selecting it
+                self._unselect(key.fileobj)
+            if telemetry is not None:
+                yield telemetry
+    
+    def _unselect(self, sock):
+        """Stop watching a vehicle socket"""
+        self._selector.unregister(sock)
+        for vehicle_id, selected in list(self._selected.items()):
+            if selected is sock:
+                del self._selected[vehicle_id]
+    
     def get_active_vehicle(self) -> Optional[VehicleProfile]:
         """Get currently active vehicle profile"""
         if self._active_vehicle_id:
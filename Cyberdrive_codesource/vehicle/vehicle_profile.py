@@ -1,14 +1,38 @@
 """
 Vehicle profile data structure
 """
+import sys
+import types
 from dataclasses import dataclass, field
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Dict, List, Any, Mapping, Optional
 from pathlib import Path
-import json
+from utils.config_loader import ConfigLoader
 
-@dataclass
+# Shared read-only stand-in for missing sub-sections
+_EMPTY = types.MappingProxyType({})
+
+_REQUIRED_KEYS = frozenset({'id', 'name', 'type'})
+
+def _deep_freeze(value: Any) -> Any:
+    """Nested dicts to read-only mappings, lists to tuples"""
+    if isinstance(value, dict):
+        return types.MappingProxyType({k: _deep_freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_deep_freeze(v) for v in value)
+    return value
+
+def _thaw(value: Any) -> Any:
+    """Inverse of _deep_freeze, giving plain JSON-serializable containers"""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(v) for v in value]
+    return value
+
+@dataclass(slots=True, frozen=True)
 class ConnectionConfig:
-    """Vehicle connection configuration"""
+    """Vehicle connection configuration (immutable once loaded)"""
     preferred_mode: str = "serial"  # serial, wifi, both
     
     # Serial config
@@ -20,9 +44,54 @@ class ConnectionConfig:
     wifi_port: int = 8888
     wifi_enabled: bool = False
 
-@dataclass
+@lru_cache(maxsize=64)
+def _load_profile_fields(path: str, mtime_ns: int, size: int) -> tuple:
+    """
+    Parse a profile file once per (path, mtime, size) stamp
+    
+    A rewritten file gets a new stamp, so stale entries are never hit.
+    """
+    data = ConfigLoader.load_json(path)  # Pickle sidecar on a cold process
+    
+    # Report every missing key at once
+    missing = _REQUIRED_KEYS - data.keys()
+    if missing:
+        raise ValueError(f"Missing keys in {path}: {', '.join(sorted(missing))}")
+    
+    # Parse connection config
+    conn_data = data.get('connection') or _EMPTY
+    serial = conn_data.get('serial') or _EMPTY
+    wifi = conn_data.get('wifi') or _EMPTY
+    connection = ConnectionConfig(
+        preferred_mode=sys.intern(conn_data.get('preferred_mode', 'serial')),
+        serial_port=serial.get('port', 'AUTO'),
+        serial_baudrate=serial.get('baudrate', 115200),
+        wifi_ip=wifi.get('ip', ''),
+        wifi_port=wifi.get('port', 8888),
+        wifi_enabled=wifi.get('enabled', False)
+    )
+    
+    return (
+        data['id'],
+        data['name'],
+        sys.intern(data['type']),  # Enum-like: one shared string per value
+        data.get('description', ''),
+        connection,
+        # Deeply read-only: shared by every profile built from this entry
+        _deep_freeze(data.get('capabilities') or {}),
+        _deep_freeze(data.get('protocol') or {}),
+        _deep_freeze(data.get('limits') or {})
+    )
+
+@dataclass(slots=True)
 class VehicleProfile:
-    """Complete vehicle profile"""
+    """
+    Complete vehicle profile
+    
+    Profiles loaded from a file are immutable in depth: capabilities,
+    protocol and limits are read-only mappings (lists become tuples).
+    To edit one, assign a new dict to the field before save_to_file.
+    """
     
     id: str
     name: str
@@ -31,44 +100,49 @@ class VehicleProfile:
     
     connection: ConnectionConfig = field(default_factory=ConnectionConfig)
     
-    capabilities: Dict[str, Any] = field(default_factory=dict)
-    protocol: Dict[str, Any] = field(default_factory=dict)
-    limits: Dict[str, Any] = field(default_factory=dict)
+    # Deeply read-only when loaded from a file; replace the whole section to edit
+    capabilities: Mapping[str, Any] = field(default_factory=dict)
+    protocol: Mapping[str, Any] = field(default_factory=dict)
+    limits: Mapping[str, Any] = field(default_factory=dict)
+    
+    # to_dict() result, kept only between freeze() and invalidate()
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
     @classmethod
     def from_json_file(cls, file_path: str | Path) -> 'VehicleProfile':
         """Load vehicle profile from JSON file"""
         path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Vehicle profile not found: {path}")
         
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # The stat doubles as the existence check and the memo stamp
+        try:
+            st = path.stat()
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Vehicle profile not found: {path}") from e
         
-        # Parse connection config
-        conn_data = data.get('connection', {})
-        connection = ConnectionConfig(
-            preferred_mode=conn_data.get('preferred_mode', 'serial'),
-            serial_port=conn_data.get('serial', {}).get('port', 'AUTO'),
-            serial_baudrate=conn_data.get('serial', {}).get('baudrate', 115200),
-            wifi_ip=conn_data.get('wifi', {}).get('ip', ''),
-            wifi_port=conn_data.get('wifi', {}).get('port', 8888),
-            wifi_enabled=conn_data.get('wifi', {}).get('enabled', False)
-        )
-        
-        return cls(
-            id=data['id'],
-            name=data['name'],
-            type=data['type'],
-            description=data.get('description', ''),
-            connection=connection,
-            capabilities=data.get('capabilities', {}),
-            protocol=data.get('protocol', {}),
-            limits=data.get('limits', {})
-        )
+        # Memoized while the file is unchanged; all fields are immutable
+        return cls(*_load_profile_fields(str(path.resolve()), st.st_mtime_ns, st.st_size))
+    
+    @staticmethod
+    def clear_cache():
+        """Forget memoized profile files"""
+        _load_profile_fields.cache_clear()
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary"""
+        """Convert to dictionary (shared cached dict after freeze())"""
+        if self._dict_cache is not None:
+            return self._dict_cache
+        return self._build_dict()
+    
+    def freeze(self):
+        """Cache to_dict() output; call invalidate() after replacing a section"""
+        self._dict_cache = self._build_dict()
+    
+    def invalidate(self):
+        """Drop the cached to_dict() output"""
+        self._dict_cache = None
+    
+    def _build_dict(self) -> Dict[str, Any]:
+        """Build the nested dictionary"""
         return {
             'id': self.id,
             'name': self.name,
@@ -86,15 +160,17 @@ class VehicleProfile:
                     'enabled': self.connection.wifi_enabled
                 }
             },
-            'capabilities': self.capabilities,
-            'protocol': self.protocol,
-            'limits': self.limits
+            'capabilities': _thaw(self.capabilities),
+            'protocol': _thaw(self.protocol),
+            'limits': _thaw(self.limits)
         }
     
-    def save_to_file(self, file_path: str | Path):
-        """Save profile to JSON file"""
-        path = Path(file_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
+    def save_to_file(self, file_path: str | Path, pretty: bool = False):
+        """
+        Save profile to JSON file
         
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=2)
\ No newline at end of file
+        Args:
+            file_path: Target file
+            pretty: 2-space indented output for hand-edited files (default: compact)
+        """
+        ConfigLoader.save_json(self.to_dict(), file_path, indent=2 if pretty else None)
\ No newline at end of file